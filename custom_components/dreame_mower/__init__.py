@@ -26,7 +26,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Dreame Mower from a config entry."""
     
     # Create coordinator
-    coordinator = DreameMowerCoordinator(hass, entry=entry)
+    coordinator = await DreameMowerCoordinator.async_create(hass, entry)
     
     # Connect to the device
     await coordinator.async_connect_device()
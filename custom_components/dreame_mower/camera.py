@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import logging
+from operator import itemgetter
 import os
-from typing import Any
-from threading import Timer
+import time
+from typing import Any, Callable
+
+import orjson
 
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.components.lawn_mower import LawnMowerActivity  # type: ignore[attr-defined]
@@ -18,13 +23,32 @@ from .coordinator import DreameMowerCoordinator
 from .entity import DreameMowerEntity
 
 from .dreame.const import STATUS_PROPERTY, map_status_to_activity, POSE_COVERAGE_PROPERTY
-from .dreame.property.pose_coverage import POSE_COVERAGE_COORDINATES_PROPERTY_NAME
-from .dreame.svg_map_generator import generate_svg_live_image, generate_svg_map_image
+from .dreame.property.pose_coverage import BUNDLE_COORDINATES_FIELD, POSE_COVERAGE_BUNDLE_PROPERTY_NAME
+from .dreame.svg_map_generator import PATH_BREAK_SENTINEL, generate_svg_live_image, generate_svg_map_image
 
 _LOGGER = logging.getLogger(__name__)
 
 # Pose coverage property request interval during live mowing sessions
 POSE_COVERAGE_REQUEST_INTERVAL = 120  # 2 minutes in seconds
+# Bounds for the adaptive request interval: backs off while no coordinates arrive
+# and tightens again once they do
+POSE_COVERAGE_MIN_INTERVAL = 60
+POSE_COVERAGE_MAX_INTERVAL = 600
+POSE_COVERAGE_IDLE_FACTOR = 5  # Idle for this many intervals doubles the interval
+
+# Maximum number of live coordinates kept for the current session
+LIVE_COORDINATES_MAX_POINTS = 2000
+
+# Delay before rendering a live image so bursts of coordinates share one render
+LIVE_RENDER_BATCH_DELAY = 0.2  # seconds
+# Live renders wait until this many new points arrived or this much time passed since the last one
+LIVE_RENDER_POINT_THRESHOLD = 5
+LIVE_RENDER_MIN_INTERVAL = 0.5  # seconds
+
+# Historical file scan: number of changed top-level subdirectories above which they are
+# rescanned in parallel, and the upper bound on scanner threads
+HISTORICAL_SCAN_PARALLEL_THRESHOLD = 2
+HISTORICAL_SCAN_MAX_WORKERS = 8
 
 
 async def async_setup_entry(
@@ -51,7 +75,8 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
         self._attr_translation_key = "map_camera"
         self._attr_supported_features = CameraEntityFeature.ON_OFF
         
-        # Set content type for SVG images
+        # Set content type for SVG images. Bytes are served as-is: the camera proxy
+        # view sends no Content-Encoding header, so pre-compressed SVG would not render.
         self.content_type = "image/svg+xml"
         
         # Current map data
@@ -59,27 +84,52 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
         self._historical_file_path: str | None = None
         self._image_bytes: bytes | None = None
         self._is_on = True
+        # Inputs of the last rendered image, used to skip redundant re-renders
+        self._last_render_key: tuple[Any, ...] | None = None
+        self._last_svg_hash: bytes | None = None  # Digest of _image_bytes
 
         # Live mode state
-        self._live_coordinates: list[dict[str, Any]] = []  # Current session live coordinates
+        self._live_coordinates: deque[dict[str, Any]] = deque(maxlen=LIVE_COORDINATES_MAX_POINTS)  # Current session live coordinates
         self._base_map_boundary: list[list[int]] = []  # Base map boundary from previous session
+        self._base_map_boundary_version = 0  # Bumped whenever the boundary is re-extracted
+        self._live_points_received = 0  # Total live points seen, unaffected by the 2000 cap
+        self._render_task: asyncio.Task | None = None  # In-flight coalesced live render
+        self._render_pending = False  # Another render was requested while one was in flight
+        self._live_render_future: asyncio.Future[bytes] | None = None  # Latest live render in the executor
+        self._last_render_points = 0  # _live_points_received at the last live render
+        self._last_render_ts = 0.0  # Monotonic time of the last live render
         
         # Periodic property request timer for live mode
-        self._pose_coverage_timer: Timer | None = None
+        self._pose_coverage_timer: asyncio.TimerHandle | None = None
         self._timer_interval = POSE_COVERAGE_REQUEST_INTERVAL
+        self._last_activity_ts = time.monotonic()  # Last time live coordinates arrived
+        self._last_timer_ts = self._last_activity_ts  # Last time the timer fired
+
+        # Dedicated executor for blocking cloud calls so polling doesn't starve the default pool
+        self._cloud_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dreame-cloud")
+        # Single worker for SVG rendering: renders never overlap and don't compete with HA's I/O pool
+        self._svg_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dreame-svg")
 
         # Initial docked state based on current status        
         self._docked = map_status_to_activity(coordinator.device.status_code) == LawnMowerActivity.DOCKED
         
         # Historical files cache
-        self._historical_files_cache: list[tuple[str, float]] = []  # [(file_path, mtime), ...]
+        self._newest_historical_file: tuple[str, float] | None = None  # (file_path, mtime)
         self._cache_built = False
+        # Per top-level subdirectory: ({dir_path: mtime}, newest (file_path, mtime) or None)
+        self._subtree_cache: dict[str, tuple[dict[str, float], tuple[str, float] | None]] = {}
         
         # Track current rotation to detect changes
         self._current_rotation = self.config_entry.options.get(CONF_MAP_ROTATION, 0)
         
         # Register for property change notifications
-        self.coordinator.device.register_property_callback(self._handle_property_change)
+        self._property_dispatch: dict[str, Callable[[Any], None]] = {
+            POSE_COVERAGE_BUNDLE_PROPERTY_NAME: self._handle_pose_coverage_update,
+            STATUS_PROPERTY.name: self._handle_status_change,
+        }
+        self._property_callback_handle = self.coordinator.device.register_property_callback(
+            self._handle_property_change, self._property_dispatch
+        )
 
     async def async_added_to_hass(self) -> None:
         """Called when entity is added to Home Assistant."""
@@ -100,8 +150,19 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
 
     async def async_will_remove_from_hass(self) -> None:
         """Called when entity is being removed from Home Assistant."""
+        # Stop device updates first so they cannot re-arm the timer or submit
+        # work to the executors shut down below
+        self.coordinator.device.unregister_property_callback(self._property_callback_handle)
+
         # Ensure timer is stopped and cleaned up
         self._stop_pose_coverage_timer()
+        self._render_pending = False
+        if self._render_task is not None:
+            self._render_task.cancel()
+        # Wait for the executor threads to exit without blocking the event loop
+        loop = asyncio.get_running_loop()
+        for executor in (self._cloud_executor, self._svg_executor):
+            await loop.run_in_executor(None, executor.shutdown)
         await super().async_will_remove_from_hass()
 
     async def _async_config_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -113,11 +174,12 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
             if self._is_on:
                 if self._live_coordinates:
                     # Re-render live image
-                    await self._async_update_live_image()
+                    changed = await self._async_update_live_image()
                 else:
                     # Re-render static map
-                    await self._async_update_image()
-                self.async_write_ha_state()
+                    changed = await self._async_update_image()
+                if changed:
+                    self.async_write_ha_state()
 
     async def _request_pose_coverage_property(self) -> None:
         """Request POSE_COVERAGE_PROPERTY from device to maintain live data stream.
@@ -132,20 +194,24 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
                 "piid": POSE_COVERAGE_PROPERTY.piid
             }]
             # Run the blocking HTTP call in an executor to avoid blocking the event loop
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            await self.hass.loop.run_in_executor(
+                self._cloud_executor,
                 lambda: self.coordinator.device.cloud_device.get_properties(parameters, retry_count=1)
             )
         except Exception as ex:
             _LOGGER.warning("Failed to request pose coverage property: %s", ex)
 
     def _start_pose_coverage_timer(self) -> None:
-        """Start periodic timer to request pose coverage property during live mowing."""
+        """Start periodic timer to request pose coverage property during live mowing.
+
+        Must be called from the event loop thread.
+        """
         if self._pose_coverage_timer is not None:
             self._pose_coverage_timer.cancel()
         
-        self._pose_coverage_timer = Timer(self._timer_interval, self._pose_coverage_timer_callback)
-        self._pose_coverage_timer.start()
+        self._pose_coverage_timer = self.hass.loop.call_later(
+            self._timer_interval, self._pose_coverage_timer_callback
+        )
 
     def _stop_pose_coverage_timer(self) -> None:
         """Stop periodic timer for pose coverage property requests."""
@@ -155,9 +221,12 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
 
     def _pose_coverage_timer_callback(self) -> None:
         """Timer callback to request pose coverage property and schedule next request."""
+        self._pose_coverage_timer = None
         try:
-            # Schedule the async property request as a task
-            self.hass.create_task(self._request_pose_coverage_property())
+            self._adapt_timer_interval()
+
+            # Schedule the async property request as a task (runs on the event loop)
+            self.hass.async_create_task(self._request_pose_coverage_property())
             
             # Schedule next request if still in live mode (not docked)
             if not self._docked:
@@ -165,24 +234,35 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
         except Exception as ex:
             _LOGGER.error("Error in pose coverage timer callback: %s", ex)
 
+    def _adapt_timer_interval(self) -> None:
+        """Double the request interval while idle, halve it when coordinates keep arriving."""
+        now = time.monotonic()
+        if self._last_activity_ts > self._last_timer_ts:
+            self._timer_interval = max(POSE_COVERAGE_MIN_INTERVAL, self._timer_interval // 2)
+        elif now - self._last_activity_ts > POSE_COVERAGE_IDLE_FACTOR * self._timer_interval:
+            self._timer_interval = min(POSE_COVERAGE_MAX_INTERVAL, self._timer_interval * 2)
+        self._last_timer_ts = now
+
     async def _refresh_historical_files_cache(self) -> None:
         """Refresh the historical files cache by scanning the ali_dreame directory."""
         try:
-            loop = asyncio.get_event_loop()
-            self._historical_files_cache = await loop.run_in_executor(
-                None, self._build_historical_files_list_sync
+            self._newest_historical_file = await self.hass.loop.run_in_executor(
+                None, self._find_newest_historical_file_sync
             )
             self._cache_built = True
         except Exception as ex:
             _LOGGER.error("Failed to refresh historical files cache: %s", ex)
-            self._historical_files_cache = []
+            self._newest_historical_file = None
             self._cache_built = True
 
-    def _build_historical_files_list_sync(self) -> list[tuple[str, float]]:
-        """Build the historical files list synchronously (runs in executor).
+    def _find_newest_historical_file_sync(self) -> tuple[str, float] | None:
+        """Find the most recently modified historical file synchronously (runs in executor).
+        
+        Top-level subdirectories are only walked again when the mtime of one of
+        their directories changed, so an unchanged tree costs one stat per directory.
         
         Returns:
-            List of (file_path, mtime) tuples sorted by modification time (newest first)
+            (file_path, mtime) of the newest .json file, or None if none found
         """
         try:
             ali_dreame_path = os.path.join(
@@ -193,46 +273,112 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
             )
             
             if not os.path.exists(ali_dreame_path):
-                return []
+                self._subtree_cache.clear()
+                return None
             
-            # Find all .json files recursively
-            json_files = []
-            for root, dirs, files in os.walk(ali_dreame_path):
-                for file in files:
-                    if file.endswith('.json'):
-                        full_path = os.path.join(root, file)
+            candidates = []
+            subtree_cache: dict[str, tuple[dict[str, float], tuple[str, float] | None]] = {}
+            stale_subdirs = []
+            with os.scandir(ali_dreame_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        cached = self._subtree_cache.get(entry.path)
+                        if cached is None or not self._subtree_unchanged_sync(cached[0]):
+                            stale_subdirs.append(entry.path)
+                        else:
+                            subtree_cache[entry.path] = cached
+                    elif entry.name.endswith('.json'):
                         try:
-                            # Get file modification time
-                            mtime = os.path.getmtime(full_path)
-                            json_files.append((full_path, mtime))
+                            candidates.append((entry.path, entry.stat().st_mtime))
                         except OSError as ex:
-                            _LOGGER.warning("Could not stat file %s: %s", full_path, ex)
-                            continue  # Skip files we can't stat
+                            _LOGGER.warning("Could not stat file %s: %s", entry.path, ex)
             
-            # Sort by modification time (newest first)
-            json_files.sort(key=lambda x: x[1], reverse=True)
-            return json_files
+            if stale_subdirs:
+                # Top-level subtrees are independent, scan them in parallel when worthwhile
+                if len(stale_subdirs) > HISTORICAL_SCAN_PARALLEL_THRESHOLD:
+                    with ThreadPoolExecutor(
+                        max_workers=min(HISTORICAL_SCAN_MAX_WORKERS, len(stale_subdirs)),
+                        thread_name_prefix="dreame-scan",
+                    ) as executor:
+                        results = list(executor.map(self._scan_subtree_sync, stale_subdirs))
+                else:
+                    results = [self._scan_subtree_sync(path) for path in stale_subdirs]
+                subtree_cache.update(zip(stale_subdirs, results))
+            
+            self._subtree_cache = subtree_cache
+            candidates.extend(newest for _, newest in subtree_cache.values() if newest is not None)
+            return max(candidates, key=itemgetter(1), default=None)
             
         except Exception as ex:
-            _LOGGER.error("Error building historical files list: %s", ex)
-            return []
+            _LOGGER.error("Error scanning historical files: %s", ex)
+            return None
+
+    @staticmethod
+    def _subtree_unchanged_sync(dir_mtimes: dict[str, float]) -> bool:
+        """Return True if no directory of a previously scanned subtree was modified."""
+        try:
+            return all(os.stat(path).st_mtime == mtime for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+
+    @staticmethod
+    def _scan_subtree_sync(path: str) -> tuple[dict[str, float], tuple[str, float] | None]:
+        """Scan a subtree and return its directory mtimes and newest (file_path, mtime) .json file."""
+        dir_mtimes: dict[str, float] = {}
+        newest: tuple[str, float] | None = None
+        try:
+            dir_mtimes[path] = os.stat(path).st_mtime
+        except OSError as ex:
+            _LOGGER.warning("Could not stat directory %s: %s", path, ex)
+            return dir_mtimes, newest
+        
+        # os.scandir hands back DirEntry objects carrying the file type, so only
+        # one stat per entry is needed and paths are joined by the OS layer
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+                                pending.append(entry.path)
+                            elif entry.name.endswith('.json') and entry.is_file():
+                                mtime = entry.stat().st_mtime
+                                if newest is None or mtime > newest[1]:
+                                    newest = (entry.path, mtime)
+                        except OSError as ex:
+                            _LOGGER.warning("Could not stat file %s: %s", entry.path, ex)
+                            continue  # Skip entries we can't stat
+            except OSError as ex:
+                _LOGGER.warning("Could not scan directory %s: %s", current, ex)
+        return dir_mtimes, newest
 
     def _handle_property_change(self, property_name: str, value: Any) -> None:
         """Handle property changes from the device."""
-        if property_name == POSE_COVERAGE_COORDINATES_PROPERTY_NAME:
-            self._handle_live_coordinates_update(value)
-        elif property_name == STATUS_PROPERTY.name:
-            new_state = map_status_to_activity(value) == LawnMowerActivity.DOCKED
-            if new_state != self._docked:
-                self._docked = new_state
-                if self._docked:
-                    # Exiting live mode when docked - stop timer and clear coordinates
-                    self._stop_pose_coverage_timer()
-                    self._live_coordinates.clear()
-                    self.hass.create_task(self._async_update_image(force_refresh=True))
-                else:
-                    # Entering live mode when undocked - start timer
-                    self._start_pose_coverage_timer()
+        handler = self._property_dispatch.get(property_name)
+        if handler is not None:
+            handler(value)
+
+    def _handle_status_change(self, value: Any) -> None:
+        """Switch between live and historical mode when the docked state changes."""
+        new_state = map_status_to_activity(value) == LawnMowerActivity.DOCKED
+        if new_state != self._docked:
+            self._docked = new_state
+            # Property callbacks arrive on the MQTT thread, timer handles live on the loop
+            if self._docked:
+                # Exiting live mode when docked - stop timer and clear coordinates
+                self.hass.loop.call_soon_threadsafe(self._stop_pose_coverage_timer)
+                self._live_coordinates.clear()
+                self.hass.create_task(self._async_update_image(force_refresh=True))
+            else:
+                # Entering live mode when undocked - start timer
+                self.hass.loop.call_soon_threadsafe(self._start_pose_coverage_timer)
+
+    def _handle_pose_coverage_update(self, pose_data: dict[str, Any]) -> None:
+        """Handle a bundled pose coverage update by tracking its coordinates."""
+        self._handle_live_coordinates_update(pose_data[BUNDLE_COORDINATES_FIELD])
 
     def _handle_live_coordinates_update(self, coordinates_data: dict[str, Any]) -> None:
         """Handle live coordinate updates during mowing session."""
@@ -241,16 +387,14 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
             if not self._live_coordinates:
                 self._extract_base_map_boundary()
             
-            # Add coordinates to live tracking
+            # Add coordinates to live tracking (oldest points are evicted by the deque)
             self._live_coordinates.append(coordinates_data)
+            self._live_points_received += 1
+            self._last_activity_ts = time.monotonic()
             
-            # Limit live coordinates to last 2000 points to avoid memory issues
-            if len(self._live_coordinates) > 2000:
-                self._live_coordinates = self._live_coordinates[-2000:]
-            
-            # Update image with new live data
+            # Update image with new live data (coalesced on the event loop)
             if self._is_on:
-                self.hass.create_task(self._async_update_live_image())
+                self.hass.loop.call_soon_threadsafe(self._schedule_live_render)
                             
         except Exception as ex:
             _LOGGER.error("Error handling live coordinates update: %s", ex)
@@ -259,43 +403,110 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
         """Extract base map boundary from current map data for live mode overlay."""
         try:
             self._base_map_boundary.clear()
+            self._base_map_boundary_version += 1
             
             if not self._current_map_data:
                 return
                 
             map_items = self._current_map_data["map"]
-            all_boundary_points = []
-            for item in map_items:
-                item_data = item.get("data", [])
-                for point in item_data:
-                    if point[0] != 2147483647 and point[1] != 2147483647:
-                        all_boundary_points.append(point)
-            
-            self._base_map_boundary = all_boundary_points
+            self._base_map_boundary = [
+                point
+                for item in map_items
+                for point in item.get("data", [])
+                if point[0] != PATH_BREAK_SENTINEL and point[1] != PATH_BREAK_SENTINEL
+            ]
                         
         except Exception as ex:
             _LOGGER.error("Error extracting base map boundary: %s", ex)
 
-    async def _async_update_live_image(self) -> None:
-        """Update camera image with live coordinates overlay."""
-        if not self._live_coordinates:
+    def _schedule_live_render(self) -> None:
+        """Schedule a live image render, coalescing bursts into one pending render.
+
+        Must be called from the event loop thread.
+        """
+        if self._render_task is not None and not self._render_task.done():
+            self._render_pending = True
             return
+        self._render_task = self.hass.async_create_task(self._async_coalesced_live_render())
+
+    async def _async_coalesced_live_render(self) -> None:
+        """Render the live image once after a short batching delay."""
+        try:
+            await asyncio.sleep(self._live_render_delay())
+            # Anything requested up to now is covered by this render
+            self._render_pending = False
+            await self._async_update_live_image()
+        finally:
+            self._render_task = None
+            if self._render_pending:
+                self._render_pending = False
+                self._schedule_live_render()
+
+    def _store_image_bytes(self, image_bytes: bytes) -> bool:
+        """Store rendered image bytes, returning False if they are identical to the current image."""
+        svg_hash = hashlib.blake2b(image_bytes, digest_size=8).digest()
+        if svg_hash == self._last_svg_hash and self._image_bytes is not None:
+            return False
+        self._image_bytes = image_bytes
+        self._last_svg_hash = svg_hash
+        return True
+
+    def _live_render_delay(self) -> float:
+        """Return how long to wait before the next live render."""
+        if self._live_points_received - self._last_render_points >= LIVE_RENDER_POINT_THRESHOLD:
+            return LIVE_RENDER_BATCH_DELAY
+        remaining = LIVE_RENDER_MIN_INTERVAL - (time.monotonic() - self._last_render_ts)
+        return max(LIVE_RENDER_BATCH_DELAY, remaining)
+
+    async def _async_update_live_image(self) -> bool:
+        """Update camera image with live coordinates overlay.
+
+        Returns:
+            True if the camera image changed
+        """
+        if not self._is_on or not self._live_coordinates:
+            return False
+
+        points_received = self._live_points_received
+        render_key = ("live", points_received, self._base_map_boundary_version, self._current_rotation)
+        if render_key == self._last_render_key and self._image_bytes is not None:
+            return False
             
+        # Latest wins: a queued older render is cancelled, a running one is discarded
+        previous = self._live_render_future
+        if previous is not None and not previous.done():
+            previous.cancel()
+
         try:
             # Generate live image in executor
-            loop = asyncio.get_event_loop()
-            self._image_bytes = await loop.run_in_executor(
-                None,
+            future = self.hass.loop.run_in_executor(
+                self._svg_executor,
                 self._generate_live_image
             )
+            self._live_render_future = future
+            try:
+                image_bytes = await future
+            except asyncio.CancelledError:
+                if self._live_render_future is not future:
+                    return False
+                raise
+            if self._live_render_future is not future:
+                return False
+            self._live_render_future = None
+            self._last_render_key = render_key
+            self._last_render_points = points_received
+            self._last_render_ts = time.monotonic()
+            return self._store_image_bytes(image_bytes)
             
         except Exception as ex:
             _LOGGER.error("Failed to update live image: %s", ex)
+            return False
 
     def _generate_live_image(self) -> bytes:
         """Generate live map image in SVG format with current coordinates overlay."""
+        # Snapshot the deque: the generator indexes it and MQTT may append meanwhile
         return generate_svg_live_image(
-            self._live_coordinates,
+            list(self._live_coordinates),
             self._base_map_boundary,
             self._current_map_data,
             self.coordinator,
@@ -316,6 +527,12 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
         """Turn off the camera."""
         self._is_on = False
         self._image_bytes = None
+        # Drop pending live renders so the executor is free right away
+        self._render_pending = False
+        if self._render_task is not None:
+            self._render_task.cancel()
+        if self._live_render_future is not None:
+            self._live_render_future.cancel()
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
@@ -337,15 +554,16 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
     def _load_historical_file_sync(self, full_path: str) -> dict[str, Any] | None:
         """Synchronously load historical file - runs in executor."""
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Read raw bytes, orjson parses them without a separate decode step
+            with open(full_path, 'rb') as f:
+                return orjson.loads(f.read())
                 
         except Exception as ex:
             _LOGGER.error("Error reading historical file %s: %s", full_path, ex)
             return None
 
     async def _find_most_recent_historical_file(self, force_refresh: bool = False) -> str | None:
-        """Find the most recent historical file using the cached file list.
+        """Find the most recent historical file using the cached scan result.
         
         Returns:
             Full path to the most recent .json file, or None if none found
@@ -356,8 +574,8 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
                 await self._refresh_historical_files_cache()
             
             # Return the most recent file from cache
-            if self._historical_files_cache:
-                return self._historical_files_cache[0][0]  # First item is most recent
+            if self._newest_historical_file:
+                return self._newest_historical_file[0]
             else:
                 return None
                 
@@ -365,25 +583,35 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
             _LOGGER.error("Error getting most recent historical file from cache: %s", ex)
             return None
 
-    async def _async_update_image(self, force_refresh: bool = False) -> None:
-        """Update the camera image by generating a new map visualization."""
+    async def _async_update_image(self, force_refresh: bool = False) -> bool:
+        """Update the camera image by generating a new map visualization.
+
+        Returns:
+            True if the camera image changed
+        """
+        if not self._is_on:
+            return False
 
         historical_file = await self._find_most_recent_historical_file(force_refresh=force_refresh)
         if not historical_file:
             _LOGGER.warning("No historical file found")
-            return
+            return False
+
+        mtime = self._newest_historical_file[1] if self._newest_historical_file else None
+        render_key = ("map", historical_file, mtime, self._current_rotation)
+        if render_key == self._last_render_key and self._image_bytes is not None:
+            return False
 
         try:
             # Load historical file directly (we already have the full path)
-            loop = asyncio.get_event_loop()
-            self._current_map_data = await loop.run_in_executor(
+            self._current_map_data = await self.hass.loop.run_in_executor(
                 None,
                 self._load_historical_file_sync,
                 historical_file
             )
             if self._current_map_data is None:
                 _LOGGER.warning("Failed to load historical file data: %s", historical_file)
-                return
+                return False
             
             # Set relative path for display purposes
             www_dreame_path = os.path.join(self.hass.config.config_dir, "www", "dreame")
@@ -394,18 +622,20 @@ class DreameMowerCameraEntity(DreameMowerEntity, Camera):
 
         except Exception as ex:
             _LOGGER.warning("Could not load historical file %s: %s", historical_file, ex)
-            return
+            return False
                     
         try:
-            # Generate the map image in an executor to avoid blocking (including module loading)
-            loop = asyncio.get_event_loop()
-            self._image_bytes = await loop.run_in_executor(
-                None, 
+            # Generate the map image in an executor to avoid blocking
+            image_bytes = await self.hass.loop.run_in_executor(
+                self._svg_executor,
                 self._generate_map_image,
                 self._current_map_data
             )
+            self._last_render_key = render_key
+            return self._store_image_bytes(image_bytes)
         except Exception as ex:
             _LOGGER.error("Failed to generate map image: %s", ex)
+            return False
 
     def _generate_map_image(self, data: dict[str, Any]) -> bytes:
         """Generate map image in SVG format from map data."""
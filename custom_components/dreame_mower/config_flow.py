@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 from typing import Any
+import hashlib
 import logging
+import time
 
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
@@ -39,6 +41,14 @@ DREAME_MODELS = [
     "dreame.mower.",
     "mova.mower.",
 ]
+# "<vendor>.mower" part of supported model ids, for set lookups
+SUPPORTED_VENDOR_PREFIXES = frozenset(prefix.rstrip(".") for prefix in DREAME_MODELS)
+
+
+def _is_supported_model(model: str) -> bool:
+    """Return True if the model id is "<vendor>.mower.<name>" for a supported vendor."""
+    parts = model.split(".", 2)
+    return len(parts) == 3 and f"{parts[0]}.{parts[1]}" in SUPPORTED_VENDOR_PREFIXES
 
 model_map = {
     "dreame.mower.p2255": "DREAME A1",
@@ -61,6 +71,71 @@ NOTIFICATION = {
     NOTIFICATION_ERROR: "Error",
     NOTIFICATION_MQTT_DISCOVERY: "MQTT Message Discovery (for developers)",
 }
+NOTIFICATION_DEFAULT = list(NOTIFICATION)
+
+# Static form choices and schemas
+ACCOUNT_TYPE_CHOICES = {
+    "dreame": "Dreamehome",
+    "mova": "MOVAhome",
+}
+COUNTRY_CHOICES = ["cn", "eu", "us", "ru", "sg"]
+MAP_ROTATION_CHOICES = [0, 90, 180, 270]
+
+USER_STEP_SCHEMA = vol.Schema({
+    vol.Required("account_type", default="dreame"): vol.In(ACCOUNT_TYPE_CHOICES)
+})
+
+
+# Authenticated cloud sessions shared by config flows, reused for AUTH_CACHE_TTL seconds
+AUTH_CACHE_TTL = 300
+_AUTH_CACHE: dict[tuple[str, str, str, str], tuple[float, DreameMowerCloudBase]] = {}
+
+
+def _get_or_create_auth(
+    username: str, password: str, country: str, account_type: str, ttl: float = AUTH_CACHE_TTL
+) -> DreameMowerCloudBase:
+    """Return a cached connected cloud session, logging in on a miss (blocking)."""
+    key = _auth_cache_key(username, password, country, account_type)
+    cached = _AUTH_CACHE.get(key)
+    if cached is not None:
+        created, auth = cached
+        if time.monotonic() - created < ttl and auth.connected:
+            return auth
+
+    auth = DreameMowerCloudBase(
+        username=username,
+        password=password,
+        country=country,
+        account_type=account_type,
+    )
+    auth.connect()
+    now = time.monotonic()
+    # Evict expired sessions so abandoned flows do not keep them alive
+    for stale_key, (created, _) in list(_AUTH_CACHE.items()):
+        if now - created >= ttl:
+            _AUTH_CACHE.pop(stale_key, None)
+    if auth.connected:
+        _AUTH_CACHE[key] = (now, auth)
+    else:
+        _AUTH_CACHE.pop(key, None)
+    return auth
+
+
+def _auth_cache_key(
+    username: str, password: str, country: str, account_type: str
+) -> tuple[str, str, str, str]:
+    """Return the session cache key for the given credentials."""
+    # Hash the password into the key so changed credentials never hit a stale session
+    return (account_type, username, country, hashlib.sha256(password.encode()).hexdigest())
+
+
+def _connect_and_list(
+    username: str, password: str, country: str, account_type: str
+) -> tuple[DreameMowerCloudBase, dict[str, Any] | None]:
+    """Log in to the cloud and fetch the device list in a single executor job."""
+    auth = _get_or_create_auth(username, password, country, account_type)
+    devices = auth.get_devices() if auth.connected else None
+    return auth, devices
 
 
 class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -83,11 +158,17 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.password: str | None = None
         self.country: str | None = None
         self.devices: dict[str, Any] = {}
+        self._resolved_names: dict[str, str] = {}
         self.device_id: str | None = None
         self.mac: str | None = None
         self.model: str | None = None
         self.serial_number: str | None = None
         self.name: str | None = None
+        self._auth: DreameMowerCloudBase | None = None
+        self._auth_key: tuple[str, str, str, str] | None = None
+        # Form schemas keyed by their defaults, reused on error retries
+        self._login_schema_cache: dict[tuple[str, str], vol.Schema] = {}
+        self._options_schema_cache: dict[tuple[str | None], vol.Schema] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -96,12 +177,7 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(
                 step_id="user",
-                data_schema=vol.Schema({
-                    vol.Required("account_type", default="dreame"): vol.In({
-                        "dreame": "Dreamehome",
-                        "mova": "MOVAhome"
-                    })
-                })
+                data_schema=USER_STEP_SCHEMA,
             )
 
         account_type = user_input.get("account_type", "dreame")
@@ -112,12 +188,7 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required("account_type", default="dreame"): vol.In({
-                    "dreame": "Dreamehome",
-                    "mova": "MOVAhome"
-                })
-            }),
+            data_schema=USER_STEP_SCHEMA,
             errors={"base": "invalid_account_type"}
         )
 
@@ -159,49 +230,34 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self.country = country
 
                 try:
-                    # Use lightweight auth class for device discovery
-                    auth = DreameMowerCloudBase(
-                        username=self.username,
-                        password=self.password,
-                        country=self.country,
-                        account_type=account_type,
+                    # Use lightweight auth class for device discovery, kept for the connect step
+                    auth, devices = await self.hass.async_add_executor_job(
+                        _connect_and_list, username, password, country, account_type
                     )
-                    await self.hass.async_add_executor_job(auth.connect)
+                    self._auth = auth if auth.connected else None
+                    self._auth_key = _auth_cache_key(username, password, country, account_type)
 
                     if auth.connected is False:
                         errors["base"] = "login_error"
                     elif auth.connected:
-                        devices = await self.hass.async_add_executor_job(
-                            auth.get_devices
-                        )
                         if devices:
-                            found = list(
-                                filter(
-                                    lambda d: any(
-                                        str(d["model"]).startswith(prefix)
-                                        for prefix in DREAME_MODELS
-                                    ),
-                                    devices["page"]["records"],
-                                )
-                            )
-
+                            records = (devices.get("page") or {}).get("records") or ()
+                            # List name: "<name> - <model name> (<model id>)", the resolved
+                            # device name is kept for _extract_info
+                            model_name = model_map.get
                             self.devices = {}
-                            for device in found:
-                                name = (
-                                    device["customName"]
-                                    if device["customName"]
-                                    and len(device["customName"]) > 0
-                                    else device["deviceInfo"]["displayName"]
-                                )
-                                # Use more informative device name formatting
-                                model = model_map.get(device["model"], device["model"])
-                                modelId = device["model"]
-                                list_name = f"{name} - {model} ({modelId})"
+                            self._resolved_names = {}
+                            for device in records:
+                                if not _is_supported_model(str(device["model"])):
+                                    continue
+                                name = device["customName"] or device["deviceInfo"]["displayName"]
+                                list_name = f"{name} - {model_name(device['model'], device['model'])} ({device['model']})"
                                 self.devices[list_name] = device
+                                self._resolved_names[list_name] = name
 
                             if self.devices:
                                 if len(self.devices) == 1:
-                                    self._extract_info(list(self.devices.values())[0])
+                                    self._extract_device(next(iter(self.devices)))
                                     return await self.async_step_connect()
                                 return await self.async_step_devices()
 
@@ -214,17 +270,41 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=account_type,
-            data_schema=vol.Schema(
+            data_schema=self._build_login_schema(),
+            errors=errors,
+        )
+
+    def _build_login_schema(self) -> vol.Schema:
+        """Return the login form schema for the current defaults."""
+        key = (self.username or "", self.country or "eu")
+        schema = self._login_schema_cache.get(key)
+        if schema is None:
+            schema = vol.Schema(
                 {
-                    vol.Required(CONF_USERNAME, default=self.username or ""): str,
-                    vol.Required(CONF_PASSWORD, default=self.password or ""): str,
-                    vol.Required(CONF_COUNTRY, default=self.country or "eu"): vol.In(
-                        ["cn", "eu", "us", "ru", "sg"]
+                    vol.Required(CONF_USERNAME, default=key[0]): str,
+                    # Callable default: the password is read when the form is shown, never cached
+                    vol.Required(CONF_PASSWORD, default=lambda: self.password or ""): str,
+                    vol.Required(CONF_COUNTRY, default=key[1]): vol.In(
+                        COUNTRY_CHOICES
                     ),
                 }
-            ),
-            errors=errors,
-        )
+            )
+            self._login_schema_cache[key] = schema
+        return schema
+
+    def _build_options_schema(self) -> vol.Schema:
+        """Return the options form schema for the current device name."""
+        key = (self.name,)
+        schema = self._options_schema_cache.get(key)
+        if schema is None:
+            schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=self.name): str,
+                    vol.Required(CONF_NOTIFY, default=NOTIFICATION_DEFAULT): cv.multi_select(NOTIFICATION),
+                }
+            )
+            self._options_schema_cache[key] = schema
+        return schema
 
     async def async_step_devices(
         self, user_input: dict[str, Any] | None = None
@@ -232,7 +312,7 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle multiple Dreame/Mova Mower devices found."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            self._extract_info(self.devices[user_input["devices"]])
+            self._extract_device(user_input["devices"])
             return await self.async_step_connect()
 
         return self.async_show_form(
@@ -256,14 +336,17 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not self.device_id:
                 raise ValueError("Device ID is required for connection")
 
-            # Test connection using cloud base
-            auth = DreameMowerCloudBase(
-                username=self.username,
-                password=self.password,
-                country=self.country,
-                account_type=self.account_type,
-            )
-            await self.hass.async_add_executor_job(auth.connect)
+            # Reuse the session from the login step, only log in again if it was lost
+            auth = self._auth
+            if auth is None or not auth.connected:
+                auth = await self.hass.async_add_executor_job(
+                    _get_or_create_auth,
+                    self.username,
+                    self.password,
+                    self.country,
+                    self.account_type,
+                )
+                self._auth = auth if auth.connected else None
             
             if not auth.connected:
                 raise ConnectionError("Failed to connect to cloud service")
@@ -282,7 +365,7 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     }
                 )
 
-            if self.model and any(self.model.startswith(prefix) for prefix in DREAME_MODELS):
+            if self.model and _is_supported_model(self.model):
                 if self.name is None:
                     self.name = self.model
                 return await self.async_step_options()
@@ -313,6 +396,9 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Fallback: keep using the device name if an unexpected type appears
                 entry_title = self.name
 
+            # The entry logs in on its own, so the flow's session is no longer needed
+            if self._auth_key is not None:
+                _AUTH_CACHE.pop(self._auth_key, None)
             return self.async_create_entry(
                 title=entry_title,
                 data={
@@ -333,23 +419,25 @@ class DreameMowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME, default=self.name): str,
-                    vol.Required(CONF_NOTIFY, default=list(NOTIFICATION)): cv.multi_select(NOTIFICATION),
-                }
-            ),
+            data_schema=self._build_options_schema(),
             errors=errors,
         )
 
-    def _extract_info(self, device_info: dict[str, Any]) -> None:
+    def _extract_device(self, list_name: str) -> None:
+        """Extract device information for a device picked from the discovered list."""
+        self._extract_info(self.devices[list_name], self._resolved_names.get(list_name))
+
+    def _extract_info(self, device_info: dict[str, Any], name: str | None = None) -> None:
         """Extract device information from the API response."""
         self.device_id = device_info.get("did")
         self.mac = device_info.get("mac")  # MAC is directly in device_info, not nested
         self.model = device_info.get("model")
         self.serial_number = device_info.get("sn", "")  # Serial number never changes
         
-        # Extract device name
+        # Extract device name, unless already resolved while listing devices
+        if name is not None:
+            self.name = name
+            return
         self.name = (
             device_info["customName"]
             if device_info.get("customName") and len(device_info["customName"]) > 0
@@ -371,6 +459,6 @@ class DreameMowerOptionsFlow(OptionsFlow):
             step_id="init",
             data_schema=vol.Schema({
                 vol.Required(CONF_NOTIFY, default=current_notify): cv.multi_select(NOTIFICATION),
-                vol.Required(CONF_MAP_ROTATION, default=current_rotation): vol.In([0, 90, 180, 270]),
+                vol.Required(CONF_MAP_ROTATION, default=current_rotation): vol.In(MAP_ROTATION_CHOICES),
             }),
         )
\ No newline at end of file
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import threading
+from datetime import datetime
+from typing import Any, Callable, Iterable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -33,11 +36,74 @@ from .dreame.property import (
     NOTIFICATION_CODE_FIELD,
     NOTIFICATION_NAME_FIELD,
     NOTIFICATION_DESCRIPTION_FIELD,
+    BMS_PHASE_PROPERTY_NAME,
+    POSE_COVERAGE_PROGRESS_PROPERTY_NAME,
+    POSE_COVERAGE_COORDINATES_PROPERTY_NAME,
+    POSE_COVERAGE_BUNDLE_PROPERTY_NAME,
+)
+from .dreame.const import (
+    BATTERY_PROPERTY,
+    BLUETOOTH_PROPERTY,
+    CHARGING_STATUS_PROPERTY,
+    POWER_STATE_PROPERTY,
+    PROPERTY_FIRMWARE,
+    SCHEDULING_TASK_PROPERTY,
+    STATUS_PROPERTY,
 )
-from .dreame.const import POWER_STATE_PROPERTY
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window in which device property updates are coalesced into one coordinator refresh
+DEVICE_UPDATE_DEBOUNCE = 0.05  # seconds
+
+# Coordinator data keys and the coordinator properties they are read from.
+# Static keys come from the config entry and never change for an entry. The path
+# history is left out on purpose: it is copied on every read, consumers pull it
+# through the mowing_path_history property when they need it.
+STATIC_DATA_FIELDS: dict[str, str] = {
+    "name": "device_name",
+    "mac": "device_mac",
+    "model": "device_model",
+    "serial": "device_serial",
+    "manufacturer": "device_manufacturer",
+}
+DEVICE_DATA_FIELDS: dict[str, str] = {
+    "connected": "device_connected",
+    "last_update": "last_update",
+    "firmware": "device_firmware",
+    "battery_percent": "device_battery_percent",
+    "status": "device_status",
+    "bluetooth_connected": "device_bluetooth_connected",
+    "charging_status": "device_charging_status",
+    "bms_phase": "device_bms_phase",
+    "current_task_data": "current_task_data",
+    "mowing_progress_percent": "mowing_progress_percent",
+    "current_area_sqm": "current_area_sqm",
+    "total_area_sqm": "total_area_sqm",
+    "mower_coordinates": "mower_coordinates",
+    "current_segment": "current_segment",
+    "mower_heading": "mower_heading",
+}
+
+# Device property names and the data keys they affect. Properties not listed here
+# refresh every device key; "last_update" is refreshed on every update.
+PROPERTY_TO_DATA_KEYS: dict[str, tuple[str, ...]] = {
+    "connected": ("connected",),
+    PROPERTY_FIRMWARE: ("firmware",),
+    BATTERY_PROPERTY.name: ("battery_percent",),
+    STATUS_PROPERTY.name: ("status",),
+    BLUETOOTH_PROPERTY.name: ("bluetooth_connected",),
+    CHARGING_STATUS_PROPERTY.name: ("charging_status",),
+    BMS_PHASE_PROPERTY_NAME: ("bms_phase",),
+    SCHEDULING_TASK_PROPERTY.name: ("current_task_data",),
+    POSE_COVERAGE_PROGRESS_PROPERTY_NAME: ("mowing_progress_percent", "current_area_sqm", "total_area_sqm"),
+    POSE_COVERAGE_COORDINATES_PROPERTY_NAME: ("mower_coordinates", "current_segment", "mower_heading"),
+    POSE_COVERAGE_BUNDLE_PROPERTY_NAME: (
+        "mowing_progress_percent", "current_area_sqm", "total_area_sqm",
+        "mower_coordinates", "current_segment", "mower_heading",
+    ),
+}
+
 class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Dreame Mower implementation."""
 
@@ -46,20 +112,48 @@ class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         *,
         entry: ConfigEntry,
+        device: DreameMowerDevice | None = None,
     ) -> None:
-        """Initialize Dreame Mower coordinator."""
+        """Initialize Dreame Mower coordinator.
+
+        Use async_create to build the device off the event loop; without a
+        device one is created synchronously.
+        """
         self.entry = entry
 
-        self.device = DreameMowerDevice(
-            entry.data[CONF_DID],
-            entry.data[CONF_USERNAME],
-            entry.data[CONF_PASSWORD],
-            entry.data[CONF_ACCOUNT_TYPE],
-            entry.data[CONF_COUNTRY],
-            hass.config.config_dir)
+        self.device = device if device is not None else self._create_device(hass, entry)
         
-        # Initialize issue reporter for unhandled MQTT messages
-        self.issue_reporter = DreameMowerIssueReporter(hass)
+        # Issue reporter for notifications, created on first use
+        self._issue_reporter: DreameMowerIssueReporter | None = None
+
+        # Enabled notification types, rebuilt when the options change
+        self._notify_set: frozenset[str] = frozenset(entry.options.get(CONF_NOTIFY, ()))
+        entry.async_on_unload(entry.add_update_listener(self._options_updated))
+
+        # Notification handlers keyed by device property name
+        self._notify_handlers: dict[str, Callable[[Any], None]] = {
+            DEVICE_CODE_ERROR_PROPERTY_NAME: self._notify_error,
+            DEVICE_CODE_WARNING_PROPERTY_NAME: self._notify_warning,
+            DEVICE_CODE_INFO_PROPERTY_NAME: self._notify_info,
+            POWER_STATE_PROPERTY.name: self._notify_power,
+            "unhandled_mqtt": self._notify_unhandled,
+        }
+
+        # Last device timestamp and its ISO string, formatted only when it changes
+        self._last_update_cache: tuple[datetime | None, str] = (None, "")
+
+        # Debounced refresh state for bursts of device property updates
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_requested = False
+        self._refresh_delay = DEVICE_UPDATE_DEBOUNCE
+
+        # Persistent coordinator data, only keys touched by device updates are re-read
+        self._data: dict[str, Any] = {
+            key: getattr(self, attr) for key, attr in STATIC_DATA_FIELDS.items()
+        }
+        # Filled on the MQTT worker thread and swapped out on the event loop
+        self._dirty_keys: set[str] = set()
+        self._dirty_keys_lock = threading.Lock()
         
         # Initialize coordinator with no automatic polling (device will push updates)
         super().__init__(
@@ -75,31 +169,42 @@ class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
 
 
+    @classmethod
+    async def async_create(cls, hass: HomeAssistant, entry: ConfigEntry) -> DreameMowerCoordinator:
+        """Create a coordinator, constructing the device in the executor."""
+        device = await hass.async_add_executor_job(cls._create_device, hass, entry)
+        return cls(hass, entry=entry, device=device)
+
+    @staticmethod
+    def _create_device(hass: HomeAssistant, entry: ConfigEntry) -> DreameMowerDevice:
+        """Construct the device for a config entry."""
+        return DreameMowerDevice(
+            entry.data[CONF_DID],
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+            entry.data[CONF_ACCOUNT_TYPE],
+            entry.data[CONF_COUNTRY],
+            hass.config.config_dir)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data. This method is required by DataUpdateCoordinator."""
-        return {
-            "name": self.device_name,
-            "connected": self.device_connected,
-            "last_update": self.last_update,
-            "mac": self.device_mac,
-            "model": self.device_model,
-            "serial": self.device_serial,
-            "firmware": self.device_firmware,
-            "manufacturer": self.device_manufacturer,
-            "battery_percent": self.device_battery_percent,
-            "status": self.device_status,
-            "bluetooth_connected": self.device_bluetooth_connected,
-            "charging_status": self.device_charging_status,
-            "bms_phase": self.device_bms_phase,
-            "current_task_data": self.current_task_data,
-            "mowing_progress_percent": self.mowing_progress_percent,
-            "current_area_sqm": self.current_area_sqm,
-            "total_area_sqm": self.total_area_sqm,
-            "mower_coordinates": self.mower_coordinates,
-            "current_segment": self.current_segment,
-            "mower_heading": self.mower_heading,
-            "mowing_path_history": self.mowing_path_history,
-        }
+        with self._dirty_keys_lock:
+            self._dirty_keys.clear()
+        self._refresh_data_keys(DEVICE_DATA_FIELDS)
+        return self._data
+
+    def _refresh_data_keys(self, keys: Iterable[str]) -> None:
+        """Re-read the given device data keys into the persistent data dict."""
+        data = self._data
+        for key in keys:
+            data[key] = getattr(self, DEVICE_DATA_FIELDS[key])
+
+    @property
+    def issue_reporter(self) -> DreameMowerIssueReporter:
+        """Return the issue reporter, creating it when the first notification fires."""
+        if self._issue_reporter is None:
+            self._issue_reporter = DreameMowerIssueReporter(self.hass)
+        return self._issue_reporter
 
     @property
     def device_mac(self) -> str:
@@ -139,7 +244,10 @@ class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def last_update(self) -> str:
         """Return last update timestamp."""
-        return self.device.last_update.isoformat()
+        last_update = self.device.last_update
+        if last_update is not self._last_update_cache[0]:
+            self._last_update_cache = (last_update, last_update.isoformat())
+        return self._last_update_cache[1]
 
     @property
     def device_battery_percent(self) -> int | None:
@@ -238,93 +346,119 @@ class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     
     def _handle_device_update(self, property_name: str, value: Any) -> None:
         """Handle device property updates and notify Home Assistant."""
-        # Handle device code error notifications
-        if property_name == DEVICE_CODE_ERROR_PROPERTY_NAME and isinstance(value, dict):
-            # Create persistent notification for error device codes
-            notify_options = self.entry.options.get(CONF_NOTIFY, [])
-            if NOTIFICATION_ERROR in notify_options:
-                self.hass.create_task(
-                    self.issue_reporter.create_device_error_notification(
-                        value[NOTIFICATION_CODE_FIELD],
-                        value[NOTIFICATION_NAME_FIELD], 
-                        value[NOTIFICATION_DESCRIPTION_FIELD],
-                        self.device_model,
-                        self.device_firmware
-                    )
+        handler = self._notify_handlers.get(property_name)
+        if handler is not None:
+            handler(value)
+
+        # Remember which data keys this update touched
+        keys = PROPERTY_TO_DATA_KEYS.get(property_name)
+        with self._dirty_keys_lock:
+            self._dirty_keys.update(DEVICE_DATA_FIELDS if keys is None else keys)
+
+        # Schedule a coordinator update to notify all entities, coalescing bursts
+        # (callbacks arrive on the MQTT thread, so hop onto the loop to arm the timer)
+        if not self._refresh_requested:
+            self._refresh_requested = True
+            self.hass.loop.call_soon_threadsafe(self._arm_refresh_timer)
+
+    def _notify_error(self, value: Any) -> None:
+        """Create a persistent notification for error device codes."""
+        if isinstance(value, dict) and NOTIFICATION_ERROR in self._notify_set:
+            self.hass.create_task(
+                self.issue_reporter.create_device_error_notification(
+                    value[NOTIFICATION_CODE_FIELD],
+                    value[NOTIFICATION_NAME_FIELD], 
+                    value[NOTIFICATION_DESCRIPTION_FIELD],
+                    self.device_model,
+                    self.device_firmware
                 )
-        
-        # Handle device code warning notifications
-        elif property_name == DEVICE_CODE_WARNING_PROPERTY_NAME and isinstance(value, dict):
-            # Create persistent notification for warning device codes (optional - can be disabled)
-            notify_options = self.entry.options.get(CONF_NOTIFY, [])
-            if NOTIFICATION_WARNING in notify_options:
-                self.hass.create_task(
-                    self.issue_reporter.create_device_error_notification(
-                        value[NOTIFICATION_CODE_FIELD],
-                        value[NOTIFICATION_NAME_FIELD],
-                        value[NOTIFICATION_DESCRIPTION_FIELD], 
-                        self.device_model,
-                        self.device_firmware
-                    )
+            )
+
+    def _notify_warning(self, value: Any) -> None:
+        """Create a persistent notification for warning device codes (optional - can be disabled)."""
+        if isinstance(value, dict) and NOTIFICATION_WARNING in self._notify_set:
+            self.hass.create_task(
+                self.issue_reporter.create_device_error_notification(
+                    value[NOTIFICATION_CODE_FIELD],
+                    value[NOTIFICATION_NAME_FIELD],
+                    value[NOTIFICATION_DESCRIPTION_FIELD], 
+                    self.device_model,
+                    self.device_firmware
                 )
-        
-        # Handle device code info notifications
-        elif property_name == DEVICE_CODE_INFO_PROPERTY_NAME and isinstance(value, dict):
-            # Create persistent notification for info device codes (optional - can be disabled)
-            notify_options = self.entry.options.get(CONF_NOTIFY, [])
-            if NOTIFICATION_INFORMATION in notify_options:
-                self.hass.create_task(
-                    self.issue_reporter.create_device_info_notification(
-                        value[NOTIFICATION_CODE_FIELD],
-                        value[NOTIFICATION_NAME_FIELD],
-                        value[NOTIFICATION_DESCRIPTION_FIELD], 
-                        self.device_model,
-                        self.device_firmware
-                    )
+            )
+
+    def _notify_info(self, value: Any) -> None:
+        """Create a persistent notification for info device codes (optional - can be disabled)."""
+        if isinstance(value, dict) and NOTIFICATION_INFORMATION in self._notify_set:
+            self.hass.create_task(
+                self.issue_reporter.create_device_info_notification(
+                    value[NOTIFICATION_CODE_FIELD],
+                    value[NOTIFICATION_NAME_FIELD],
+                    value[NOTIFICATION_DESCRIPTION_FIELD], 
+                    self.device_model,
+                    self.device_firmware
                 )
-
-        # Handle POWER_STATE_PROPERTY notifications
-        elif property_name == POWER_STATE_PROPERTY.name:
-            if value == 1:  # Only notify for powered off state
-                notify_options = self.entry.options.get(CONF_NOTIFY, [])
-                if NOTIFICATION_INFORMATION in notify_options:
-                    self.hass.create_task(
-                        self.issue_reporter.create_device_info_notification(
-                            value,  # Use power state value as notification code
-                            "Mower Powered Off",
-                            "The mower has been powered off", 
-                            self.device_model,
-                            self.device_firmware
-                        )
-                    )
-        
-        # Handle special case for unhandled MQTT messages (both properties and other message types)
-        elif property_name == "unhandled_mqtt" and isinstance(value, dict):
-            # Check if user has enabled MQTT discovery notifications
-            notify_options = self.entry.options.get(CONF_NOTIFY, [])
-            if NOTIFICATION_MQTT_DISCOVERY in notify_options:
-                # Create persistent notification using issue reporter
-                self.hass.create_task(
-                    self.issue_reporter.create_unhandled_mqtt_notification(
-                        value, 
-                        self.device_model, 
-                        self.device_firmware
-                    )
+            )
+
+    def _notify_power(self, value: Any) -> None:
+        """Create a persistent notification when the mower is powered off."""
+        if value == 1 and NOTIFICATION_INFORMATION in self._notify_set:
+            self.hass.create_task(
+                self.issue_reporter.create_device_info_notification(
+                    value,  # Use power state value as notification code
+                    "Mower Powered Off",
+                    "The mower has been powered off", 
+                    self.device_model,
+                    self.device_firmware
                 )
-            else:
-                _LOGGER.debug("MQTT discovery notification skipped - user preference disabled")
-        
-        
-        # Schedule a coordinator update to notify all entities
+            )
+
+    def _notify_unhandled(self, value: Any) -> None:
+        """Create a persistent notification for unhandled MQTT messages (properties and other message types)."""
+        if not isinstance(value, dict):
+            return
+        # Check if user has enabled MQTT discovery notifications
+        if NOTIFICATION_MQTT_DISCOVERY in self._notify_set:
+            # Create persistent notification using issue reporter
+            self.hass.create_task(
+                self.issue_reporter.create_unhandled_mqtt_notification(
+                    value, 
+                    self.device_model, 
+                    self.device_firmware
+                )
+            )
+        else:
+            _LOGGER.debug("MQTT discovery notification skipped - user preference disabled")
+
+    def _arm_refresh_timer(self) -> None:
+        """Start the debounce timer for a coordinator refresh (event loop thread)."""
+        # Skip requests withdrawn by a disconnect before this callback ran
+        if self._refresh_requested and self._refresh_handle is None:
+            self._refresh_handle = self.hass.loop.call_later(
+                self._refresh_delay, self._schedule_refresh
+            )
+
+    def _schedule_refresh(self) -> None:
+        """Run one coordinator refresh for all updates received during the debounce window."""
+        self._refresh_handle = None
+        self._refresh_requested = False
         # Use async_set_updated_data to trigger entity updates
-        self.hass.create_task(self._async_handle_device_update())
+        self.hass.async_create_task(self._async_handle_device_update())
     
+    async def _options_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Rebuild the enabled notification set after an options update."""
+        self._notify_set = frozenset(entry.options.get(CONF_NOTIFY, ()))
+
     async def _async_handle_device_update(self) -> None:
         """Async handler for device updates."""
         try:
-            # Get fresh data and update all entities
-            data = await self._async_update_data()
-            self.async_set_updated_data(data)
+            # Re-read changed fields and update all entities
+            with self._dirty_keys_lock:
+                dirty_keys = self._dirty_keys
+                self._dirty_keys = set()
+            dirty_keys.add("last_update")
+            self._refresh_data_keys(dirty_keys)
+            self.async_set_updated_data(self._data)
         except Exception as ex:
             _LOGGER.exception("Error handling device update: %s", ex)
     
@@ -343,4 +477,9 @@ class DreameMowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_disconnect_device(self) -> None:
         """Disconnect from the device."""
-        await self.device.disconnect()
\ No newline at end of file
+        await self.device.disconnect()
+        # Disconnecting reports connected=False, so drop the refresh it requested
+        self._refresh_requested = False
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
\ No newline at end of file
@@ -18,6 +18,11 @@ class PropertyIdentifier(NamedTuple):
         """Check if given siid and piid match this property identifier."""
         return self.siid == siid and self.piid == piid
 
+    @property
+    def key(self) -> tuple[int, int]:
+        """Return the (siid, piid) tuple used for dispatch lookups."""
+        return (self.siid, self.piid)
+
 
 class ActionIdentifier(NamedTuple):
     """Action identifier with siid, aiid values and action name."""
@@ -40,6 +45,11 @@ class EventIdentifier(NamedTuple):
         """Check if given siid and eiid match this event identifier."""
         return self.siid == siid and self.eiid == eiid
 
+    @property
+    def key(self) -> tuple[int, int]:
+        """Return the (siid, eiid) tuple used for dispatch lookups."""
+        return (self.siid, self.eiid)
+
 
 # Device property identifiers
 PROPERTY_1_1 = PropertyIdentifier(siid=1, piid=1, name="property_1_1")
@@ -10,10 +10,16 @@ TODO: Implement connection retry logic
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import itertools
 import logging
+from operator import itemgetter
 import os
-from typing import Any, Callable
-from datetime import datetime
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable
+from datetime import datetime, timedelta
 
 from .cloud.cloud_device import DreameMowerCloudDevice
 from .utils import download_file
@@ -30,6 +36,9 @@ from .property import (
     DEVICE_CODE_INFO_PROPERTY_NAME,
     POSE_COVERAGE_PROGRESS_PROPERTY_NAME,
     POSE_COVERAGE_COORDINATES_PROPERTY_NAME,
+    POSE_COVERAGE_BUNDLE_PROPERTY_NAME,
+    BUNDLE_PROGRESS_FIELD,
+    BUNDLE_COORDINATES_FIELD,
 )
 from .const import (
     BATTERY_PROPERTY,
@@ -68,10 +77,53 @@ from .const import (
     ACTION_STOP,
     ACTION_DOCK,
     DEVICE_CODE_PROPERTY,
+    PROPERTY_1_1,
+    SETTINGS_CHANGE_PROPERTY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+# Fetches the (siid, piid) dispatch key from a property message in one call
+_GET_PROPERTY_KEY = itemgetter("siid", "piid")
+_NO_CALLBACKS: dict[int, Callable[[str, Any], None]] = {}
+
+# Notification names bound once instead of read from the identifiers per message
+_BATTERY_NAME = BATTERY_PROPERTY.name
+_STATUS_NAME = STATUS_PROPERTY.name
+_BLUETOOTH_NAME = BLUETOOTH_PROPERTY.name
+_FIRMWARE_INSTALL_STATE_NAME = FIRMWARE_INSTALL_STATE_PROPERTY.name
+_FIRMWARE_DOWNLOAD_PROGRESS_NAME = FIRMWARE_DOWNLOAD_PROGRESS_PROPERTY.name
+_SERVICE1_PROPERTY_50_NAME = SERVICE1_PROPERTY_50.name
+_SERVICE1_PROPERTY_51_NAME = SERVICE1_PROPERTY_51.name
+_SERVICE1_COMPLETION_FLAG_NAME = SERVICE1_COMPLETION_FLAG_PROPERTY.name
+_CHARGING_STATUS_NAME = CHARGING_STATUS_PROPERTY.name
+_DEVICE_CODE_NAME = DEVICE_CODE_PROPERTY.name
+_POWER_STATE_NAME = POWER_STATE_PROPERTY.name
+_SERVICE2_PROPERTY_60_NAME = SERVICE2_PROPERTY_60.name
+_SERVICE2_PROPERTY_62_NAME = SERVICE2_PROPERTY_62.name
+_SERVICE2_PROPERTY_64_NAME = SERVICE2_PROPERTY_64.name
+_SERVICE2_PROPERTY_65_NAME = SERVICE2_PROPERTY_65.name
+_DEVICE_FILE_PATH_NAME = DEVICE_FILE_PATH_PROPERTY.name
+
+# Properties whose handlers only act when the value changes, so a repeated
+# value can be dropped before dispatch
+_CHANGE_ONLY_PROPERTY_KEYS = frozenset(
+    prop.key
+    for prop in (
+        BATTERY_PROPERTY,
+        STATUS_PROPERTY,
+        BLUETOOTH_PROPERTY,
+        CHARGING_STATUS_PROPERTY,
+        FIRMWARE_INSTALL_STATE_PROPERTY,
+        FIRMWARE_DOWNLOAD_PROGRESS_PROPERTY,
+        DEVICE_FILE_PATH_PROPERTY,
+    )
+)
+
+# Recognized 2:65 task navigation values
+_TASK_NAV_VALUES = frozenset({"dm::TASK_NAV_DOCK"})
+
 
 class DreameMowerDevice:
     """Device communication handler for Dreame Mower.
@@ -80,6 +132,55 @@ class DreameMowerDevice:
     It provides a high-level interface for controlling the mower and receiving status updates.
     """
 
+    __slots__ = (
+        "_account_type",
+        "_battery_percent",
+        "_bluetooth_connected",
+        "_callback_handles",
+        "_callbacks_by_name",
+        "_charging_status",
+        "_cloud_device",
+        "_cloud_executor",
+        "_country",
+        "_device_code_handler",
+        "_device_file_path",
+        "_device_id",
+        "_file_download",
+        "_emit_legacy_pose_events",
+        "_event_dispatch",
+        "_firmware",
+        "_firmware_download_progress",
+        "_firmware_install_state",
+        "_hass_config_dir",
+        "_inbox",
+        "_inbox_worker",
+        "_last_update",
+        "_last_update_monotonic",
+        "_last_update_resolved",
+        "_last_values",
+        "_loop",
+        "_misc_handler",
+        "_mission_completed_fut",
+        "_mission_completion_handler",
+        "_monotonic_anchor",
+        "_mower_control_handler",
+        "_ota_state",
+        "_password",
+        "_pending_notifications",
+        "_pose_coverage_handler",
+        "_property_callbacks",
+        "_property_dispatch",
+        "_scheduling_handler",
+        "_service1_completion_flag",
+        "_service1_property_50",
+        "_service1_property_51",
+        "_service5_handler",
+        "_status_code",
+        "_task_handler",
+        "_username",
+        "_wall_anchor",
+    )
+
     def __init__(
         self,
         device_id: str,
@@ -115,9 +216,19 @@ class DreameMowerDevice:
             device_id=device_id,
         )
         
+        # Blocking cloud calls get their own threads instead of the shared default
+        # executor; created on first use and again after a disconnect shuts it down
+        self._cloud_executor: ThreadPoolExecutor | None = None
+        self._file_download: Future[None] | None = None
+        
         # Pullable properties
         self._firmware = "Unknown"
-        self._last_update = datetime.now()
+        # Updates record a monotonic stamp; the datetime is derived on read
+        self._wall_anchor = datetime.now()
+        self._monotonic_anchor = time.monotonic()
+        self._last_update_monotonic = self._monotonic_anchor
+        self._last_update = self._wall_anchor
+        self._last_update_resolved = self._monotonic_anchor
         self._battery_percent = 0
         self._status_code = 0
         
@@ -131,21 +242,79 @@ class DreameMowerDevice:
         self._service1_property_50: bool = False
         self._service1_property_51: bool = False
         self._service1_completion_flag: bool = False
+
+        # Pose coverage is notified as one bundled event; set to also emit the
+        # separate progress and coordinates events
+        self._emit_legacy_pose_events = False
         
         # Property handlers
         self._misc_handler = MiscPropertyHandler()
         self._device_code_handler = DeviceCodeHandler()
         self._scheduling_handler = SchedulingPropertyHandler()
+        self._task_handler = self._scheduling_handler.task_handler
         self._mower_control_handler = MowerControlPropertyHandler()
         self._service5_handler = Service5PropertyHandler()
         self._mission_completion_handler = MissionCompletionEventHandler()
         self._pose_coverage_handler = PoseCoveragePropertyHandler()
+
+        # MQTT property dispatch keyed by (siid, piid)
+        self._property_dispatch: dict[tuple[int, int], Callable[[dict[str, Any]], bool]] = {
+            BATTERY_PROPERTY.key: self._handle_battery,
+            STATUS_PROPERTY.key: self._handle_status,
+            BLUETOOTH_PROPERTY.key: self._handle_bluetooth,
+            SCHEDULING_TASK_PROPERTY.key: self._handle_scheduling,
+            SCHEDULING_SUMMARY_PROPERTY.key: self._handle_scheduling,
+            MOWER_CONTROL_STATUS_PROPERTY.key: self._handle_mower_control,
+            POSE_COVERAGE_PROPERTY.key: self._handle_pose_coverage,
+            FIRMWARE_INSTALL_STATE_PROPERTY.key: self._handle_firmware_install_state,
+            FIRMWARE_DOWNLOAD_PROGRESS_PROPERTY.key: self._handle_firmware_download_progress,
+            SERVICE1_PROPERTY_50.key: self._handle_service1_property_50,
+            SERVICE1_PROPERTY_51.key: self._handle_service1_property_51,
+            SERVICE1_COMPLETION_FLAG_PROPERTY.key: self._handle_service1_completion_flag,
+            CHARGING_STATUS_PROPERTY.key: self._handle_charging_status,
+            TASK_STATUS_PROPERTY.key: self._handle_service5,
+            SERVICE5_PROPERTY_105.key: self._handle_service5,
+            BMS_PHASE_PROPERTY.key: self._handle_service5,
+            SERVICE5_ENERGY_INDEX_PROPERTY.key: self._handle_service5,
+            SERVICE5_PROPERTY_108.key: self._handle_service5,
+            DEVICE_CODE_PROPERTY.key: self._handle_device_code,
+            POWER_STATE_PROPERTY.key: self._handle_power_state,
+            SERVICE2_PROPERTY_60.key: self._handle_service2_property_60,
+            SERVICE2_PROPERTY_62.key: self._handle_service2_property_62,
+            SERVICE2_PROPERTY_63.key: self._handle_service2_property_63,
+            SERVICE2_PROPERTY_64.key: self._handle_service2_property_64,
+            SERVICE2_PROPERTY_65.key: self._handle_service2_property_65,
+            DEVICE_FILE_PATH_PROPERTY.key: self._handle_device_file_path,
+            PROPERTY_1_1.key: self._handle_misc,
+            SETTINGS_CHANGE_PROPERTY.key: self._handle_misc,
+        }
+
+        # MQTT event dispatch keyed by (siid, eiid)
+        self._event_dispatch: dict[tuple[int, int], Callable[[int, int, list[Any]], bool]] = {
+            FIRMWARE_VALIDATION_EVENT.key: self._handle_firmware_validation_event,
+            MISSION_COMPLETION_EVENT.key: self._handle_mission_completion_event,
+        }
         
-        # Property change callbacks
-        self._property_callbacks: list[Callable[[str, Any], None]] = []
+        # Last dispatched raw value per change-only (siid, piid)
+        self._last_values: dict[tuple[int, int], Any] = {}
+
+        # Property change callbacks, for all properties and per property name
+        # keyed by the handle returned from register_property_callback
+        self._property_callbacks: dict[int, Callable[[str, Any], None]] = {}
+        self._callbacks_by_name: dict[str, dict[int, Callable[[str, Any], None]]] = {}
+        self._callback_handles = itertools.count(1)
+        self._pending_notifications = threading.local()
         
         # Stop-then-dock sequence - wait for mission completion event
-        self._mission_completed_event: asyncio.Event = asyncio.Event()
+        self._mission_completed_fut: asyncio.Future[None] | None = None
+
+        # MQTT messages are queued by the paho thread and processed on a worker
+        # thread, so slow handlers (file downloads, callbacks) never stall paho
+        self._inbox: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._inbox_worker: threading.Thread | None = None
+
+        # Event loop owning the asyncio primitives, cached once connected
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def connected(self) -> bool:
@@ -160,6 +329,11 @@ class DreameMowerDevice:
     @property
     def last_update(self) -> datetime:
         """Return timestamp of last successful update."""
+        if self._last_update_resolved != self._last_update_monotonic:
+            self._last_update_resolved = self._last_update_monotonic
+            self._last_update = self._wall_anchor + timedelta(
+                seconds=self._last_update_monotonic - self._monotonic_anchor
+            )
         return self._last_update
 
     @property
@@ -225,7 +399,7 @@ class DreameMowerDevice:
     @property
     def current_task_data(self) -> dict | None:
         """Return current task data from the TaskHandler."""
-        task_handler = self._scheduling_handler._task_handler
+        task_handler = self._task_handler
         if task_handler.task_type is None:
             return None
         return task_handler.get_notification_data()
@@ -344,27 +518,89 @@ class DreameMowerDevice:
         """Return the cloud device instance."""
         return self._cloud_device
 
-    def register_property_callback(self, callback: Callable[[str, Any], None]) -> None:
-        """Register callback for property changes."""
-        self._property_callbacks.append(callback)
+    def register_property_callback(
+        self,
+        callback: Callable[[str, Any], None],
+        names: Iterable[str] | None = None,
+    ) -> int:
+        """Register callback for property changes, optionally limited to the given names.
+
+        Callbacks run on the thread that reports the change. Coroutine callbacks
+        are detected once here and scheduled on the registering event loop.
+
+        Returns:
+            Handle to pass to unregister_property_callback
+        """
+        if asyncio.iscoroutinefunction(callback):
+            self._loop = loop = asyncio.get_running_loop()
+            async_callback = callback
+
+            def callback(property_name: str, value: Any) -> None:
+                loop.call_soon_threadsafe(loop.create_task, async_callback(property_name, value))
+
+        handle = next(self._callback_handles)
+        if names is None:
+            self._property_callbacks[handle] = callback
+        else:
+            for name in names:
+                self._callbacks_by_name.setdefault(name, {})[handle] = callback
+        return handle
+
+    def unregister_property_callback(self, handle: int) -> None:
+        """Remove a callback registered with register_property_callback."""
+        if self._property_callbacks.pop(handle, None) is not None:
+            return
+        for callbacks in self._callbacks_by_name.values():
+            callbacks.pop(handle, None)
+
+    def _has_listeners(self, property_name: str) -> bool:
+        """Return True if any callback would receive the given property."""
+        return bool(self._property_callbacks or self._callbacks_by_name.get(property_name))
 
     def _notify_property_change(self, property_name: str, value: Any) -> None:
-        """Notify all registered callbacks of property changes."""
-        for callback in self._property_callbacks:
-            try:
-                callback(property_name, value)
-            except Exception as ex:
-                _LOGGER.exception("Error in property callback: %s", ex)
+        """Notify registered callbacks of a property change.
+
+        While a message is being handled the change is buffered and flushed once
+        the message is done, keeping only the last value per property.
+        """
+        pending = getattr(self._pending_notifications, "changes", None)
+        if pending is not None:
+            pending[property_name] = value
+            return
+        self._dispatch_property_change(property_name, value)
+
+    def _dispatch_property_change(self, property_name: str, value: Any) -> None:
+        """Invoke the callbacks subscribed to a property change."""
+        for callbacks in (self._property_callbacks, self._callbacks_by_name.get(property_name, _NO_CALLBACKS)):
+            for callback in callbacks.values():
+                try:
+                    callback(property_name, value)
+                except Exception as ex:
+                    _LOGGER.exception("Error in property callback: %s", ex)
+
+    def _get_cloud_executor(self) -> ThreadPoolExecutor:
+        """Return the cloud executor, creating it if needed.
+
+        Only called from the event loop; MQTT handlers use the existing
+        executor so they cannot recreate it after a disconnect.
+        """
+        executor = self._cloud_executor
+        if executor is None:
+            executor = self._cloud_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="dreame-cloud"
+            )
+        return executor
+
+    async def _async_cloud_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking cloud call on the device's own executor."""
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_cloud_executor(), func, *args)
 
     async def fetch_device_info(self) -> dict[str, Any] | None:
         """Fetch device information from devices_list endpoint."""
         try:
             # Make REST API call to get device info from devices_list
-            loop = asyncio.get_event_loop()
-            device_info = await loop.run_in_executor(
-                None,
-                self._cloud_device.get_device_info
-            )
+            device_info = await self._async_cloud_call(self._cloud_device.get_device_info)
             
             if device_info:
                 # Update device state from devices_list response
@@ -381,60 +617,111 @@ class DreameMowerDevice:
     def _update_device_state_from_info(self, device_info: dict[str, Any]) -> None:
         """Update internal device state from devices_list response.
         
+        Invalid values raise and are reported by the caller.
+
         Args:
             device_info: Device information from devices_list endpoint
         """
-        try:
-            # Update firmware version
-            old_firmware = self._firmware
-            if "ver" in device_info:
-                self._firmware = device_info["ver"]
-                if old_firmware != self._firmware:
-                    self._notify_property_change(PROPERTY_FIRMWARE, self._firmware)
-            
-            # Update battery percentage
-            old_battery = self._battery_percent
-            if "battery" in device_info:
-                self._battery_percent = int(device_info["battery"])
-                if old_battery != self._battery_percent:
-                    self._notify_property_change(BATTERY_PROPERTY.name, self._battery_percent)
-            
-            # Update status from latestStatus enum
-            old_status_code = self._status_code
-            if "latestStatus" in device_info:
-                status_code = device_info["latestStatus"]
-                self._status_code = status_code
-                if old_status_code != status_code:
-                    self._notify_property_change(STATUS_PROPERTY.name, status_code)
-            
-            # Extract and set device model for device code handler
-            if "model" in device_info:
-                model = device_info["model"]
-                self._device_code_handler.set_model(model)
-            
-            # Update last update timestamp
-            self._last_update = datetime.now()
-        except Exception as ex:
-            _LOGGER.error("Failed to update device state from info: %s", ex)
+        # Battery and status may change here, so MQTT repeats must be re-dispatched
+        self._last_values.clear()
+
+        # Update firmware version
+        firmware = device_info.get("ver")
+        if firmware is not None and firmware != self._firmware:
+            self._firmware = firmware
+            self._notify_property_change(PROPERTY_FIRMWARE, firmware)
+        
+        # Update battery percentage
+        battery = device_info.get("battery")
+        if battery is not None:
+            battery = int(battery)
+            if battery != self._battery_percent:
+                self._battery_percent = battery
+                self._notify_property_change(_BATTERY_NAME, battery)
+        
+        # Update status from latestStatus enum
+        status_code = device_info.get("latestStatus")
+        if status_code is not None and status_code != self._status_code:
+            self._status_code = status_code
+            self._notify_property_change(_STATUS_NAME, status_code)
+        
+        # Extract and set device model for device code handler
+        model = device_info.get("model")
+        if model is not None:
+            self._device_code_handler.set_model(model)
+        
+        # Update last update timestamp
+        self._last_update_monotonic = time.monotonic()
+
+    def _enqueue_message(self, message: dict[str, Any]) -> None:
+        """Queue an incoming MQTT message for the inbox worker."""
+        self._inbox.put_nowait(message)
+
+    def _drain_inbox(self, inbox: queue.SimpleQueue[dict[str, Any] | None]) -> None:
+        """Process queued MQTT messages until the stop sentinel is received."""
+        while (message := inbox.get()) is not None:
+            try:
+                self._handle_message(message)
+            except Exception as ex:
+                _LOGGER.exception("Error handling MQTT message: %s", ex)
+
+    def _start_inbox_worker(self) -> None:
+        """Start the inbox worker thread if it is not running."""
+        if self._inbox_worker is None or not self._inbox_worker.is_alive():
+            # Each worker drains its own queue, so a previous worker still finishing
+            # after a disconnect can neither take this one's messages nor its sentinel
+            inbox: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+            self._inbox = inbox
+            self._inbox_worker = threading.Thread(
+                target=self._drain_inbox, args=(inbox,), name="dreame-mqtt-inbox", daemon=True
+            )
+            self._inbox_worker.start()
+
+    def _stop_inbox_worker(self) -> threading.Thread | None:
+        """Let the inbox worker finish queued messages and exit.
+
+        Returns the stopped worker so the caller can join it.
+        """
+        worker, self._inbox_worker = self._inbox_worker, None
+        if worker is not None:
+            self._inbox.put_nowait(None)
+        return worker
 
     def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle incoming MQTT messages from cloud device."""
+        # Buffer notifications per thread so callers on other threads are not delayed
+        pending: dict[str, Any] = {}
+        self._pending_notifications.changes = pending
+        try:
+            self._process_message(message)
+        finally:
+            self._pending_notifications.changes = None
+            for property_name, value in pending.items():
+                self._dispatch_property_change(property_name, value)
+
+    def _process_message(self, message: dict[str, Any]) -> None:
+        """Dispatch a single MQTT message to the matching handler."""
         # Update last update timestamp
-        self._last_update = datetime.now()
+        self._last_update_monotonic = time.monotonic()
         
         # Handle properties_changed method with params array
         if message.get("method") == "properties_changed" and "params" in message:
             params_list = message["params"]
             if isinstance(params_list, list):
                 for param in params_list:
-                    # Handle properties with values
-                    if isinstance(param, dict) and "siid" in param and "piid" in param and "value" in param:
-                        if (self._handle_mqtt_property_update(param)):
-                            return # Property was handled
-                    # Handle properties without values (like service1 flags)
-                    elif isinstance(param, dict) and "siid" in param and "piid" in param:
-                        if (self._handle_mqtt_property_update(param)):
-                            return # Property was handled
+                    # Params are decoded JSON objects; skip anything without siid/piid
+                    try:
+                        key = _GET_PROPERTY_KEY(param)
+                    except (KeyError, TypeError):
+                        continue
+                    # Handle properties with and without values (like service1 flags)
+                    value = param.get("value", _MISSING)
+                    if value is not _MISSING and self._last_values.get(key, _MISSING) == value:
+                        return  # Unchanged value, nothing to dispatch
+                    if (self._handle_mqtt_property_update(param)):
+                        if key in _CHANGE_ONLY_PROPERTY_KEYS:
+                            self._last_values[key] = value
+                        return # Property was handled
         
         # Handle event_occurred method with params dict
         elif message.get("method") == "event_occured" and "params" in message:
@@ -452,14 +739,15 @@ class DreameMowerDevice:
 
         # Create notification for unhandled message types with raw message
         _LOGGER.info("📨 Unhandled MQTT message: %s", message)
-        self._notify_property_change(
-            "unhandled_mqtt",
-            {
-                "type": "message",
-                "raw_message": message,
-                "event_time": datetime.now().isoformat()
-            }
-        )
+        if self._has_listeners("unhandled_mqtt"):
+            self._notify_property_change(
+                "unhandled_mqtt",
+                {
+                    "type": "message",
+                    "raw_message": message,
+                    "event_time": datetime.now().isoformat()
+                }
+            )
 
     def _handle_mqtt_property_update(self, message: dict[str, Any]) -> bool:
         """Handle MQTT property updates with siid/piid format.
@@ -470,295 +758,381 @@ class DreameMowerDevice:
         Returns:
             True if property was handled, False otherwise
         """
+        handler = self._property_dispatch.get(_GET_PROPERTY_KEY(message))
+        if handler is None:
+            return False  # Property not handled
         try:
-            siid = message["siid"]
-            piid = message["piid"]
-            
-            if BATTERY_PROPERTY.matches(siid, piid):
-                battery_value = int(message["value"])
-                old_battery = self._battery_percent
-                self._battery_percent = battery_value
-                if old_battery != battery_value:
-                    self._notify_property_change(BATTERY_PROPERTY.name, battery_value)
-            elif STATUS_PROPERTY.matches(siid, piid):
-                status_code = int(message["value"])
-                old_status_code = self._status_code
-                self._status_code = status_code
-                if old_status_code != status_code:
-                    # Reset mission completion flag when mowing starts (status 1)
-                    if status_code == 1:  # 1 = mowing
-                        self._pose_coverage_handler.reset_mission_completion()
-                    self._notify_property_change(STATUS_PROPERTY.name, status_code)
-            elif BLUETOOTH_PROPERTY.matches(siid, piid):
-                bluetooth_value = bool(message["value"])
-                old_bluetooth = self._bluetooth_connected
-                self._bluetooth_connected = bluetooth_value
-                if old_bluetooth != bluetooth_value:
-                    self._notify_property_change(BLUETOOTH_PROPERTY.name, bluetooth_value)
-            elif (SCHEDULING_TASK_PROPERTY.matches(siid, piid) or 
-                  SCHEDULING_SUMMARY_PROPERTY.matches(siid, piid)):
-                # Handle scheduling properties (2:50, 2:52) in unified handler
-                if not self._scheduling_handler.handle_property_update(siid, piid, message["value"], self._notify_property_change):
-                    return False  # Parsing failed - treat as unhandled property
-            elif MOWER_CONTROL_STATUS_PROPERTY.matches(siid, piid):
-                # Handle mower control status property (2:56)
-                if not self._mower_control_handler.handle_property_update(siid, piid, message["value"], self._notify_property_change):
-                    return False  # Parsing failed - treat as unhandled property
-            elif POSE_COVERAGE_PROPERTY.matches(siid, piid):
-                # Handle pose and coverage property (1:4) with mowing progress and coordinates
-                try:
-                    if not self._pose_coverage_handler.parse_value(message["value"]):
-                        return False  # Parsing failed
-                    
-                    # Notify progress data changes
-                    progress_data = self._pose_coverage_handler.get_progress_notification_data()
-                    self._notify_property_change(POSE_COVERAGE_PROGRESS_PROPERTY_NAME, progress_data)
-                    
-                    # Notify coordinate data changes
-                    coordinates_data = self._pose_coverage_handler.get_coordinates_notification_data()
-                    self._notify_property_change(POSE_COVERAGE_COORDINATES_PROPERTY_NAME, coordinates_data)
-                    
-                except Exception as ex:
-                    _LOGGER.error("Failed to parse pose coverage property: %s", ex)
-                    return False
-            elif FIRMWARE_INSTALL_STATE_PROPERTY.matches(siid, piid):
-                # Handle firmware installation state property (1:2) - firmware update status
-                # Values: 2 = New Firmware Available, 3 = Installing firmware after download
-                firmware_install_state = int(message["value"])
-                if firmware_install_state not in FIRMWARE_INSTALL_STATE_MAPPING:
-                    _LOGGER.warning("Unknown firmware installation state value: %s", firmware_install_state)
-                    return False  # Report false to crowdsource more information
-                old_state = self._firmware_install_state
-                self._firmware_install_state = firmware_install_state
-                if old_state != firmware_install_state:
-                    state_description = FIRMWARE_INSTALL_STATE_MAPPING[firmware_install_state]
-                    self._notify_property_change(FIRMWARE_INSTALL_STATE_PROPERTY.name, firmware_install_state)
-                    _LOGGER.info("Firmware installation state updated: %s (%s)", firmware_install_state, state_description)
-            elif FIRMWARE_DOWNLOAD_PROGRESS_PROPERTY.matches(siid, piid):
-                # Handle firmware download progress property (1:3) - firmware update download progress
-                # Value is percentage from 1 to 100 (see issue #110)
-                firmware_download_progress = int(message["value"])
-                if firmware_download_progress < 0 or firmware_download_progress > 100:
-                    _LOGGER.warning("Invalid firmware download progress value: %s", firmware_download_progress)
-                    return False  # Report false for invalid values
-                old_progress = self._firmware_download_progress
-                self._firmware_download_progress = firmware_download_progress
-                if old_progress != firmware_download_progress:
-                    self._notify_property_change(FIRMWARE_DOWNLOAD_PROGRESS_PROPERTY.name, firmware_download_progress)
-                    _LOGGER.info("Firmware download progress updated: %s%%", firmware_download_progress)
-            elif SERVICE1_PROPERTY_50.matches(siid, piid):
-                # Handle Service 1 property 50 (1:50) - appears at beginning of session
-                # Note: This property typically has no value field, just presence indicates start event
-                self._service1_property_50 = True
-                self._notify_property_change(SERVICE1_PROPERTY_50.name, True)
-                _LOGGER.debug("Service 1 property 50 triggered - session start indicator")
-            elif SERVICE1_PROPERTY_51.matches(siid, piid):
-                # Handle Service 1 property 51 (1:51) - appears at beginning of session
-                # Note: This property typically has no value field, just presence indicates start event
-                self._service1_property_51 = True
-                self._notify_property_change(SERVICE1_PROPERTY_51.name, True)
-                _LOGGER.debug("Service 1 property 51 triggered - session start indicator")
-            elif SERVICE1_COMPLETION_FLAG_PROPERTY.matches(siid, piid):
-                # Handle Service 1 completion flag (1:52) - appears after mission completion
-                # Note: This property typically has no value field, just presence indicates completion
-                self._service1_completion_flag = True
-                self._notify_property_change(SERVICE1_COMPLETION_FLAG_PROPERTY.name, True)
-            elif CHARGING_STATUS_PROPERTY.matches(siid, piid):
-                value = message["value"]
-                try:
-                    code = int(value)
-                except Exception:
-                    _LOGGER.warning("Invalid charging status value: %s", value)
-                    return False
-
-                if code not in CHARGING_STATUS_MAPPING:
-                    _LOGGER.warning("Unknown charging status enum: %s", code)
-                    return False
-
-                status_text = CHARGING_STATUS_MAPPING[code]
-                # Store and notify if changed
-                old = self._charging_status
-                self._charging_status = status_text
-                if old != status_text:
-                    self._notify_property_change(CHARGING_STATUS_PROPERTY.name, status_text)
-            elif (TASK_STATUS_PROPERTY.matches(siid, piid) or
-                  SERVICE5_PROPERTY_105.matches(siid, piid) or 
-                  BMS_PHASE_PROPERTY.matches(siid, piid) or 
-                  SERVICE5_ENERGY_INDEX_PROPERTY.matches(siid, piid) or
-                  SERVICE5_PROPERTY_108.matches(siid, piid)):
-                # Handle all Service 5 properties (5:104, 5:105, 5:106, 5:107, 5:108) in unified handler
-                if not self._service5_handler.handle_property_update(siid, piid, message["value"], self._notify_property_change):
-                    return False  # Parsing failed - treat as unhandled property
-            elif DEVICE_CODE_PROPERTY.matches(siid, piid):
-                # Use handler to parse and update device code
-                old_device_code = self._device_code_handler.device_code
-                
-                # Parse new value using handler
-                value = message["value"]
-                if self._device_code_handler.parse_value(value):
-                    # Only notify if the device code actually changed
-                    if old_device_code != self._device_code_handler.device_code:
-                        self._notify_property_change(DEVICE_CODE_PROPERTY.name, self._device_code_handler.device_code)
-                        
-                        # Create specific notifications for error, warning, and info cards
-                        notification_data = self._device_code_handler.get_notification_data()
-                        
-                        if self._device_code_handler.device_code_is_error:
-                            self._notify_property_change(DEVICE_CODE_ERROR_PROPERTY_NAME, notification_data)
-                        elif self._device_code_handler.device_code_is_warning:
-                            self._notify_property_change(DEVICE_CODE_WARNING_PROPERTY_NAME, notification_data)
-                        else:
-                            self._notify_property_change(DEVICE_CODE_INFO_PROPERTY_NAME, notification_data)
-                else:
-                    _LOGGER.warning("Failed to parse device code value: %s", value)
-                    return False
-            elif POWER_STATE_PROPERTY.matches(siid, piid):
-                # Handle power state property (2:57) - occurs when mower is turned off
-                power_state_value = int(message["value"])
-                if power_state_value == 1:
-                    self._notify_property_change(POWER_STATE_PROPERTY.name, power_state_value)
-                else:
-                    return False  # Unexpected value, handle as unhandled property
-            elif SERVICE2_PROPERTY_60.matches(siid, piid):
-                # Handle Service 2 property 60 (2:60) - simple integer value
-                property_value = int(message["value"])
-                self._notify_property_change(SERVICE2_PROPERTY_60.name, property_value)
-                _LOGGER.debug("Service 2 property 60 updated: %s", property_value)
-            elif SERVICE2_PROPERTY_62.matches(siid, piid):
-                # Handle Service 2 property 62 (2:62) - simple integer value
-                property_value = int(message["value"])
-                self._notify_property_change(SERVICE2_PROPERTY_62.name, property_value)
-                _LOGGER.debug("Service 2 property 62 updated: %s", property_value)
-            elif SERVICE2_PROPERTY_63.matches(siid, piid):
-                # Handle Service 2 property 63 (2:63) - observed in issue #134 during failed firmware download
-                # Value -33001 seen, appears to be an error code. Meaning currently unknown.
-                # Return False to enable crowdsourcing more information about this property
-                property_value = int(message["value"])
-                _LOGGER.warning("Service 2 property 63 value observed: %s (see issue #134)", property_value)
-                return False  # Report false to crowdsource more information
-            elif SERVICE2_PROPERTY_64.matches(siid, piid):
-                # Handle Service 2 property 64 (2:64) - work statistics
-                # Contains complex data about current week (cw), full week (fw), position (p), work range (wr/ws), etc.
-                # For now, just acknowledge receipt to prevent unhandled MQTT notifications
-                property_value = message["value"]
-                self._notify_property_change(SERVICE2_PROPERTY_64.name, property_value)
-                _LOGGER.debug("Service 2 property 64 (work statistics) updated")
-            elif SERVICE2_PROPERTY_65.matches(siid, piid):
-                # Handle Service 2 property 65 (2:65) - task navigation status
-                # TODO: Consider doing something useful with this property change later
-                property_value_str = str(message["value"])
-                if property_value_str == "dm::TASK_NAV_DOCK":
-                    self._notify_property_change(SERVICE2_PROPERTY_65.name, property_value_str)
-                    _LOGGER.debug("2:65 value: %s", property_value_str)
-                else:
-                    _LOGGER.debug("Unrecognized 2:65 value: %s", property_value_str)
-                    return False  # Report false for unrecognized values
-            elif DEVICE_FILE_PATH_PROPERTY.matches(siid, piid):
-                # Handle file path property (99:10) - provides cloud file paths for:
-                # - Firmware/OTA update packages (when firmware updates are available)
-                # - Device log files (when user selects "Report logs" in the app)
-                device_file_path = str(message["value"])
-                old_device_file_path = self._device_file_path
-                self._device_file_path = device_file_path
-                if old_device_file_path != device_file_path:
-                    self._notify_property_change(DEVICE_FILE_PATH_PROPERTY.name, device_file_path)
-                    _LOGGER.info("Device file path updated: %s", device_file_path)
-                    
-                    # Attempt to download the file
-                    result = download_file(
-                        file_path=device_file_path,
-                        get_download_url=self._cloud_device.get_file_download_url,
-                        hass_config_dir=self._hass_config_dir,
-                        timeout=60
-                    )
-                    
-                    if result:
-                        # Notify about successful download with metadata
-                        self._notify_property_change("device_file_downloaded", result)
-            elif MiscPropertyHandler.matches(siid, piid):
-                # Handle miscellaneous properties (1:1, 2:51) in unified misc handler
-                if not self._misc_handler.handle_property_update(siid, piid, message["value"], self._notify_property_change):
-                    return False  # Parsing failed - treat as unhandled property
-            else:
-                return False  # Property not handled
-            
-        except Exception as ex:
+            return handler(message)
+        except (KeyError, ValueError, TypeError) as ex:
             _LOGGER.error("Failed to handle MQTT property update: %s", ex)
 
         return True  # Property was handled
-    
-    def _handle_mqtt_event(self, params: dict[str, Any]) -> bool:
-        """Handle MQTT event messages."""
+
+    def _handle_battery(self, message: dict[str, Any]) -> bool:
+        """Handle battery level property (3:1)."""
+        battery_value = message["value"]
+        if type(battery_value) is not int:  # MQTT values are usually ints already
+            battery_value = int(battery_value)
+        old_battery = self._battery_percent
+        self._battery_percent = battery_value
+        if old_battery != battery_value:
+            self._notify_property_change(_BATTERY_NAME, battery_value)
+        return True
+
+    def _handle_status(self, message: dict[str, Any]) -> bool:
+        """Handle device status property (2:1)."""
+        status_code = message["value"]
+        if type(status_code) is not int:
+            status_code = int(status_code)
+        old_status_code = self._status_code
+        self._status_code = status_code
+        if old_status_code != status_code:
+            # Reset mission completion flag when mowing starts (status 1)
+            if status_code == 1:  # 1 = mowing
+                self._pose_coverage_handler.reset_mission_completion()
+            self._notify_property_change(_STATUS_NAME, status_code)
+        return True
+
+    def _handle_bluetooth(self, message: dict[str, Any]) -> bool:
+        """Handle Bluetooth connection property (1:53)."""
+        bluetooth_value = bool(message["value"])
+        old_bluetooth = self._bluetooth_connected
+        self._bluetooth_connected = bluetooth_value
+        if old_bluetooth != bluetooth_value:
+            self._notify_property_change(_BLUETOOTH_NAME, bluetooth_value)
+        return True
+
+    def _handle_scheduling(self, message: dict[str, Any]) -> bool:
+        """Handle scheduling properties (2:50, 2:52) in unified handler."""
+        # Parsing failure is treated as unhandled property
+        return self._scheduling_handler.handle_property_update(
+            message["siid"], message["piid"], message["value"], self._notify_property_change
+        )
+
+    def _handle_mower_control(self, message: dict[str, Any]) -> bool:
+        """Handle mower control status property (2:56)."""
+        return self._mower_control_handler.handle_property_update(
+            message["siid"], message["piid"], message["value"], self._notify_property_change
+        )
+
+    def _handle_pose_coverage(self, message: dict[str, Any]) -> bool:
+        """Handle pose and coverage property (1:4) with mowing progress and coordinates."""
         try:
-            siid = params.get("siid")
-            eiid = params.get("eiid")
-            arguments = params.get("arguments", [])
+            if not self._pose_coverage_handler.parse_value(message["value"]):
+                return False  # Parsing failed
+            
+            emit_bundle = self._has_listeners(POSE_COVERAGE_BUNDLE_PROPERTY_NAME)
+            emit_progress = self._emit_legacy_pose_events and self._has_listeners(POSE_COVERAGE_PROGRESS_PROPERTY_NAME)
+            emit_coordinates = self._emit_legacy_pose_events and self._has_listeners(POSE_COVERAGE_COORDINATES_PROPERTY_NAME)
             
-            if siid is None or eiid is None:
-                _LOGGER.warning("Invalid event parameters: %s", params)
-                return False
+            # Only build the notification payloads someone will receive
+            if emit_bundle or emit_progress:
+                progress_data = self._pose_coverage_handler.get_progress_notification_data()
+            if emit_bundle or emit_coordinates:
+                coordinates_data = self._pose_coverage_handler.get_coordinates_notification_data()
             
-            # Handle firmware validation event (1:1)
-            if FIRMWARE_VALIDATION_EVENT.matches(siid, eiid):
-                _LOGGER.info("Firmware validation event received: siid=%d, eiid=%d", siid, eiid)
-                self._notify_property_change(FIRMWARE_VALIDATION_EVENT.name, {
-                    "siid": siid,
-                    "eiid": eiid,
-                    "timestamp": datetime.now().isoformat()
+            # Notify progress and coordinate changes as a single event
+            if emit_bundle:
+                self._notify_property_change(POSE_COVERAGE_BUNDLE_PROPERTY_NAME, {
+                    BUNDLE_PROGRESS_FIELD: progress_data,
+                    BUNDLE_COORDINATES_FIELD: coordinates_data,
                 })
-                return True
+            if emit_progress:
+                self._notify_property_change(POSE_COVERAGE_PROGRESS_PROPERTY_NAME, progress_data)
+            if emit_coordinates:
+                self._notify_property_change(POSE_COVERAGE_COORDINATES_PROPERTY_NAME, coordinates_data)
             
-            # Handle mission completion event (4:1)
-            if MISSION_COMPLETION_EVENT.matches(siid, eiid):
-                handled = self._mission_completion_handler.handle_event(siid, eiid, arguments, self._notify_property_change)
-                if handled:
-                    # Signal that mission is completed for stop-then-dock sequence
-                    self._mission_completed_event.set()
-                    
-                    # Mark mission as completed in pose coverage handler to cap progress at 100%
-                    self._pose_coverage_handler.mark_mission_completed()
-                    
-                    if self._mission_completion_handler.has_data_file:
-                        self._mission_completion_handler.download_and_set_data_file(
-                            self._cloud_device.get_file_download_url, self._hass_config_dir
-                        )
-                return handled
-
-            _LOGGER.warning("Unhandled event %d:%d with arguments: %s", siid, eiid, arguments)
+        except Exception as ex:
+            _LOGGER.error("Failed to parse pose coverage property: %s", ex)
+            return False
+        return True
+
+    def _handle_firmware_install_state(self, message: dict[str, Any]) -> bool:
+        """Handle firmware installation state property (1:2) - firmware update status."""
+        # Values: 2 = New Firmware Available, 3 = Installing firmware after download
+        firmware_install_state = message["value"]
+        if type(firmware_install_state) is not int:
+            firmware_install_state = int(firmware_install_state)
+        state_description = FIRMWARE_INSTALL_STATE_MAPPING.get(firmware_install_state, _MISSING)
+        if state_description is _MISSING:
+            _LOGGER.warning("Unknown firmware installation state value: %s", firmware_install_state)
+            return False  # Report false to crowdsource more information
+        old_state = self._firmware_install_state
+        self._firmware_install_state = firmware_install_state
+        if old_state != firmware_install_state:
+            self._notify_property_change(_FIRMWARE_INSTALL_STATE_NAME, firmware_install_state)
+            _LOGGER.info("Firmware installation state updated: %s (%s)", firmware_install_state, state_description)
+        return True
+
+    def _handle_firmware_download_progress(self, message: dict[str, Any]) -> bool:
+        """Handle firmware download progress property (1:3) - firmware update download progress."""
+        # Value is percentage from 1 to 100 (see issue #110)
+        firmware_download_progress = message["value"]
+        if type(firmware_download_progress) is not int:
+            firmware_download_progress = int(firmware_download_progress)
+        if firmware_download_progress < 0 or firmware_download_progress > 100:
+            _LOGGER.warning("Invalid firmware download progress value: %s", firmware_download_progress)
+            return False  # Report false for invalid values
+        old_progress = self._firmware_download_progress
+        self._firmware_download_progress = firmware_download_progress
+        if old_progress != firmware_download_progress:
+            self._notify_property_change(_FIRMWARE_DOWNLOAD_PROGRESS_NAME, firmware_download_progress)
+            _LOGGER.info("Firmware download progress updated: %s%%", firmware_download_progress)
+        return True
+
+    def _handle_service1_property_50(self, message: dict[str, Any]) -> bool:
+        """Handle Service 1 property 50 (1:50) - appears at beginning of session."""
+        # Note: This property typically has no value field, just presence indicates start event
+        if not self._service1_property_50:  # Presence flag, only the first occurrence is a change
+            self._service1_property_50 = True
+            self._notify_property_change(_SERVICE1_PROPERTY_50_NAME, True)
+            _LOGGER.debug("Service 1 property 50 triggered - session start indicator")
+        return True
+
+    def _handle_service1_property_51(self, message: dict[str, Any]) -> bool:
+        """Handle Service 1 property 51 (1:51) - appears at beginning of session."""
+        # Note: This property typically has no value field, just presence indicates start event
+        if not self._service1_property_51:
+            self._service1_property_51 = True
+            self._notify_property_change(_SERVICE1_PROPERTY_51_NAME, True)
+            _LOGGER.debug("Service 1 property 51 triggered - session start indicator")
+        return True
+
+    def _handle_service1_completion_flag(self, message: dict[str, Any]) -> bool:
+        """Handle Service 1 completion flag (1:52) - appears after mission completion."""
+        # Note: This property typically has no value field, just presence indicates completion
+        if not self._service1_completion_flag:
+            self._service1_completion_flag = True
+            self._notify_property_change(_SERVICE1_COMPLETION_FLAG_NAME, True)
+        return True
+
+    def _handle_charging_status(self, message: dict[str, Any]) -> bool:
+        """Handle charging status property (3:2)."""
+        value = message["value"]
+        try:
+            code = value if type(value) is int else int(value)
+        except Exception:
+            _LOGGER.warning("Invalid charging status value: %s", value)
             return False
+
+        status_text = CHARGING_STATUS_MAPPING.get(code)
+        if status_text is None:
+            _LOGGER.warning("Unknown charging status enum: %s", code)
+            return False
+
+        # Store and notify if changed
+        old = self._charging_status
+        self._charging_status = status_text
+        if old != status_text:
+            self._notify_property_change(_CHARGING_STATUS_NAME, status_text)
+        return True
+
+    def _handle_service5(self, message: dict[str, Any]) -> bool:
+        """Handle all Service 5 properties (5:104 - 5:108) in unified handler."""
+        return self._service5_handler.handle_property_update(
+            message["siid"], message["piid"], message["value"], self._notify_property_change
+        )
+
+    def _handle_device_code(self, message: dict[str, Any]) -> bool:
+        """Handle device code property (2:2) via the device code handler."""
+        old_device_code = self._device_code_handler.device_code
+        
+        # Parse new value using handler
+        value = message["value"]
+        if not self._device_code_handler.parse_value(value):
+            _LOGGER.warning("Failed to parse device code value: %s", value)
+            return False
+
+        # Only notify if the device code actually changed
+        if old_device_code != self._device_code_handler.device_code:
+            self._notify_property_change(_DEVICE_CODE_NAME, self._device_code_handler.device_code)
             
-        except Exception as ex:
+            # Create specific notifications for error, warning, and info cards
+            notification_data = self._device_code_handler.get_notification_data()
+            
+            if self._device_code_handler.device_code_is_error:
+                self._notify_property_change(DEVICE_CODE_ERROR_PROPERTY_NAME, notification_data)
+            elif self._device_code_handler.device_code_is_warning:
+                self._notify_property_change(DEVICE_CODE_WARNING_PROPERTY_NAME, notification_data)
+            else:
+                self._notify_property_change(DEVICE_CODE_INFO_PROPERTY_NAME, notification_data)
+        return True
+
+    def _handle_power_state(self, message: dict[str, Any]) -> bool:
+        """Handle power state property (2:57) - occurs when mower is turned off."""
+        power_state_value = message["value"]
+        if type(power_state_value) is not int:
+            power_state_value = int(power_state_value)
+        if power_state_value != 1:
+            return False  # Unexpected value, handle as unhandled property
+        self._notify_property_change(_POWER_STATE_NAME, power_state_value)
+        return True
+
+    def _handle_service2_property_60(self, message: dict[str, Any]) -> bool:
+        """Handle Service 2 property 60 (2:60) - simple integer value."""
+        property_value = message["value"]
+        if type(property_value) is not int:
+            property_value = int(property_value)
+        self._notify_property_change(_SERVICE2_PROPERTY_60_NAME, property_value)
+        _LOGGER.debug("Service 2 property 60 updated: %s", property_value)
+        return True
+
+    def _handle_service2_property_62(self, message: dict[str, Any]) -> bool:
+        """Handle Service 2 property 62 (2:62) - simple integer value."""
+        property_value = message["value"]
+        if type(property_value) is not int:
+            property_value = int(property_value)
+        self._notify_property_change(_SERVICE2_PROPERTY_62_NAME, property_value)
+        _LOGGER.debug("Service 2 property 62 updated: %s", property_value)
+        return True
+
+    def _handle_service2_property_63(self, message: dict[str, Any]) -> bool:
+        """Handle Service 2 property 63 (2:63) - observed in issue #134 during failed firmware download."""
+        # Value -33001 seen, appears to be an error code. Meaning currently unknown.
+        # Return False to enable crowdsourcing more information about this property
+        property_value = message["value"]
+        if type(property_value) is not int:
+            property_value = int(property_value)
+        _LOGGER.warning("Service 2 property 63 value observed: %s (see issue #134)", property_value)
+        return False  # Report false to crowdsource more information
+
+    def _handle_service2_property_64(self, message: dict[str, Any]) -> bool:
+        """Handle Service 2 property 64 (2:64) - work statistics."""
+        # Contains complex data about current week (cw), full week (fw), position (p), work range (wr/ws), etc.
+        # For now, just acknowledge receipt to prevent unhandled MQTT notifications
+        property_value = message["value"]
+        self._notify_property_change(_SERVICE2_PROPERTY_64_NAME, property_value)
+        _LOGGER.debug("Service 2 property 64 (work statistics) updated")
+        return True
+
+    def _handle_service2_property_65(self, message: dict[str, Any]) -> bool:
+        """Handle Service 2 property 65 (2:65) - task navigation status."""
+        # TODO: Consider doing something useful with this property change later
+        property_value_str = message["value"]
+        if type(property_value_str) is not str:
+            property_value_str = str(property_value_str)
+        if property_value_str not in _TASK_NAV_VALUES:
+            _LOGGER.debug("Unrecognized 2:65 value: %s", property_value_str)
+            return False  # Report false for unrecognized values
+        self._notify_property_change(_SERVICE2_PROPERTY_65_NAME, property_value_str)
+        _LOGGER.debug("2:65 value: %s", property_value_str)
+        return True
+
+    def _handle_device_file_path(self, message: dict[str, Any]) -> bool:
+        """Handle file path property (99:10).
+
+        Provides cloud file paths for firmware/OTA update packages (when firmware
+        updates are available) and device log files (when user selects "Report logs"
+        in the app).
+        """
+        device_file_path = str(message["value"])
+        old_device_file_path = self._device_file_path
+        self._device_file_path = device_file_path
+        if old_device_file_path != device_file_path:
+            self._notify_property_change(_DEVICE_FILE_PATH_NAME, device_file_path)
+            _LOGGER.info("Device file path updated: %s", device_file_path)
+            
+            # Download on the cloud executor so MQTT handling is not held up;
+            # it only exists while connected, so a late message is dropped
+            executor = self._cloud_executor
+            if executor is None:
+                _LOGGER.debug("Not connected, skipping download of %s", device_file_path)
+            else:
+                self._file_download = executor.submit(self._download_device_file, device_file_path)
+        return True
+
+    def _download_device_file(self, device_file_path: str) -> None:
+        """Download a device file and notify on success."""
+        result = download_file(
+            file_path=device_file_path,
+            get_download_url=self._cloud_device.get_file_download_url,
+            hass_config_dir=self._hass_config_dir,
+            timeout=60
+        )
+        
+        if result:
+            # Notify about successful download with metadata
+            self._notify_property_change("device_file_downloaded", result)
+
+    def _handle_misc(self, message: dict[str, Any]) -> bool:
+        """Handle miscellaneous properties (1:1, 2:51) in unified misc handler."""
+        return self._misc_handler.handle_property_update(
+            message["siid"], message["piid"], message["value"], self._notify_property_change
+        )
+    
+    def _handle_mqtt_event(self, params: dict[str, Any]) -> bool:
+        """Handle MQTT event messages."""
+        siid = params.get("siid")
+        eiid = params.get("eiid")
+        
+        if siid is None or eiid is None:
+            _LOGGER.warning("Invalid event parameters: %s", params)
+            return False
+        
+        handler = self._event_dispatch.get((siid, eiid))
+        if handler is None:
+            _LOGGER.warning("Unhandled event %d:%d with arguments: %s", siid, eiid, params.get("arguments"))
+            return False
+        try:
+            return handler(siid, eiid, params.get("arguments") or [])
+        except (KeyError, ValueError, TypeError) as ex:
             _LOGGER.error("Failed to handle MQTT event: %s", ex)
             return False
 
+    def _handle_firmware_validation_event(self, siid: int, eiid: int, arguments: list[Any]) -> bool:
+        """Handle firmware validation event (1:1)."""
+        _LOGGER.info("Firmware validation event received: siid=%d, eiid=%d", siid, eiid)
+        self._notify_property_change(FIRMWARE_VALIDATION_EVENT.name, {
+            "siid": siid,
+            "eiid": eiid,
+            "timestamp": time.time()
+        })
+        return True
+
+    def _handle_mission_completion_event(self, siid: int, eiid: int, arguments: list[Any]) -> bool:
+        """Handle mission completion event (4:1)."""
+        handled = self._mission_completion_handler.handle_event(siid, eiid, arguments, self._notify_property_change)
+        if handled:
+            # Signal that mission is completed for stop-then-dock sequence
+            # Events are handled off the event loop; futures are not thread-safe
+            fut = self._mission_completed_fut
+            if fut is not None:
+                fut.get_loop().call_soon_threadsafe(self._resolve_mission_completed, fut)
+            
+            # Mark mission as completed in pose coverage handler to cap progress at 100%
+            self._pose_coverage_handler.mark_mission_completed()
+            
+            if self._mission_completion_handler.has_data_file:
+                self._mission_completion_handler.download_and_set_data_file(
+                    self._cloud_device.get_file_download_url, self._hass_config_dir
+                )
+        return handled
+
     def _handle_mqtt_props(self, params: dict[str, Any]) -> bool:
         """Handle MQTT props messages with direct property updates."""
         handled_any = False
         
-        try:
-            # Handle individual properties in the params dict
-            for key, value in params.items():
-                if key == "ota_state":
-                    # Handle OTA state updates
-                    old_ota_state = getattr(self, '_ota_state', None)
-                    self._ota_state = value
-                    if old_ota_state != value:
-                        self._notify_property_change("ota_state", value)
-                        _LOGGER.debug("OTA state updated: %s", value)
-                    handled_any = True
-                else:
-                    # Log unhandled properties for future implementation
-                    _LOGGER.debug("Unhandled props parameter: %s = %s", key, value)
-            
-            return handled_any
-            
-        except Exception as ex:
-            _LOGGER.error("Failed to handle MQTT props: %s", ex)
-            return False
+        # Handle individual properties in the params dict
+        for key, value in params.items():
+            if key == "ota_state":
+                # Handle OTA state updates
+                old_ota_state = self._ota_state
+                self._ota_state = value
+                if old_ota_state != value:
+                    self._notify_property_change("ota_state", value)
+                    _LOGGER.debug("OTA state updated: %s", value)
+                handled_any = True
+            else:
+                # Log unhandled properties for future implementation
+                _LOGGER.debug("Unhandled props parameter: %s = %s", key, value)
+        
+        return handled_any
 
     def _handle_connected(self) -> None:
         """Handle cloud device connection established."""
-        self._last_update = datetime.now()
+        # Re-anchor the wall clock so derived timestamps do not drift
+        self._wall_anchor = datetime.now()
+        self._monotonic_anchor = self._last_update_monotonic = time.monotonic()
         self._notify_property_change("connected", True)
 
     def _handle_disconnected(self) -> None:
@@ -768,20 +1142,20 @@ class DreameMowerDevice:
 
     async def connect(self) -> bool:
         """Connect to the device."""
+        self._loop = asyncio.get_running_loop()
+        self._start_inbox_worker()
         try:
             # Connect to cloud device with required callbacks (run in executor to avoid blocking)
-            loop = asyncio.get_event_loop()
-            connected = await loop.run_in_executor(
-                None,
+            connected = await self._async_cloud_call(
                 lambda: self._cloud_device.connect(
-                    message_callback=self._handle_message,
+                    message_callback=self._enqueue_message,
                     connected_callback=self._handle_connected,
                     disconnected_callback=self._handle_disconnected
                 )
             )
             
             if connected:
-                self._last_update = datetime.now()
+                self._last_update_monotonic = time.monotonic()
                 
                 # Fetch initial device information (battery, status, firmware) after successful connection
                 try:
@@ -803,16 +1177,28 @@ class DreameMowerDevice:
         """Disconnect from the device."""
         try:
             # Run disconnect in executor to avoid blocking
-            await asyncio.get_event_loop().run_in_executor(None, self._cloud_device.disconnect)
+            await self._async_cloud_call(self._cloud_device.disconnect)
             self._notify_property_change("connected", False)
         except Exception as ex:
             _LOGGER.error("Error disconnecting from device %s: %s", self._device_id, ex)
+        finally:
+            loop = asyncio.get_running_loop()
+            worker = self._stop_inbox_worker()
+            # Wait for the background threads to exit without blocking the event loop
+            if worker is not None:
+                await loop.run_in_executor(None, worker.join)
+            # Presence flags only notify on first sight, so re-arm them for the
+            # next connection once no worker can set them anymore
+            self._service1_property_50 = False
+            self._service1_property_51 = False
+            self._service1_completion_flag = False
+            executor, self._cloud_executor = self._cloud_executor, None
+            if executor is not None:
+                await loop.run_in_executor(None, executor.shutdown)
 
     async def start_mowing(self) -> bool:
         """Start mowing operation."""
-        if not await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._cloud_device.execute_action(ACTION_START_MOWING)
-        ):
+        if not await self._async_cloud_call(self._cloud_device.execute_action, ACTION_START_MOWING):
             _LOGGER.error("Failed to send START_MOWING command")
             return False
         
@@ -824,14 +1210,21 @@ class DreameMowerDevice:
 
     async def pause(self) -> bool:
         """Pause current operation."""
-        if not await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._cloud_device.execute_action(ACTION_PAUSE)
-        ):
+        if not await self._async_cloud_call(self._cloud_device.execute_action, ACTION_PAUSE):
             _LOGGER.error("Failed to send PAUSE command")
             return False
         self._notify_property_change("activity", "paused")
         return True
 
+    @staticmethod
+    def _resolve_mission_completed(fut: asyncio.Future[None], timed_out: bool = False) -> None:
+        """Resolve a pending mission completion wait."""
+        if fut.done():
+            return
+        if timed_out:
+            _LOGGER.warning("Timeout waiting for mission completion event, sending DOCK anyway")
+        fut.set_result(None)
+
     async def return_to_dock(self) -> bool:
         """Return mower to dock.
         
@@ -841,28 +1234,27 @@ class DreameMowerDevice:
         Returns:
             True if dock sequence completed successfully, False otherwise
         """
-        # Clear any previous event state
-        self._mission_completed_event.clear()
+        loop = self._loop or asyncio.get_running_loop()
+        self._mission_completed_fut = fut = loop.create_future()
         
         # Send STOP command
-        if not await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._cloud_device.execute_action(ACTION_STOP)
-        ):
+        if not await self._async_cloud_call(self._cloud_device.execute_action, ACTION_STOP):
             _LOGGER.error("Failed to send STOP command")
+            self._mission_completed_fut = None
             return False
         
         self._notify_property_change("activity", "stopping")
         
         # Wait for MISSION_COMPLETION event (4:1) with 30-second timeout
+        timeout_handle = loop.call_later(30.0, self._resolve_mission_completed, fut, True)
         try:
-            await asyncio.wait_for(self._mission_completed_event.wait(), timeout=30.0)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Timeout waiting for mission completion event, sending DOCK anyway")
+            await fut
+        finally:
+            timeout_handle.cancel()
+            self._mission_completed_fut = None
         
         # Send DOCK command
-        if not await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._cloud_device.execute_action(ACTION_DOCK)
-        ):
+        if not await self._async_cloud_call(self._cloud_device.execute_action, ACTION_DOCK):
             _LOGGER.error("Failed to send DOCK command")
             return False
        
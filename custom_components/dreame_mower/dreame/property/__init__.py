@@ -55,6 +55,9 @@ from .pose_coverage import (
     PoseCoveragePropertyHandler,
     POSE_COVERAGE_PROGRESS_PROPERTY_NAME,
     POSE_COVERAGE_COORDINATES_PROPERTY_NAME,
+    POSE_COVERAGE_BUNDLE_PROPERTY_NAME,
+    BUNDLE_PROGRESS_FIELD,
+    BUNDLE_COORDINATES_FIELD,
     PROGRESS_CURRENT_AREA_FIELD,
     PROGRESS_TOTAL_AREA_FIELD,
     PROGRESS_PERCENT_FIELD,
@@ -123,6 +126,9 @@ __all__ = [
     "PoseCoveragePropertyHandler",
     "POSE_COVERAGE_PROGRESS_PROPERTY_NAME",
     "POSE_COVERAGE_COORDINATES_PROPERTY_NAME",
+    "POSE_COVERAGE_BUNDLE_PROPERTY_NAME",
+    "BUNDLE_PROGRESS_FIELD",
+    "BUNDLE_COORDINATES_FIELD",
     "PROGRESS_CURRENT_AREA_FIELD",
     "PROGRESS_TOTAL_AREA_FIELD",
     "PROGRESS_PERCENT_FIELD",
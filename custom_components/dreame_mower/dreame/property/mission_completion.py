@@ -19,6 +19,7 @@ import os
 from typing import Dict, Any, List, Callable
 from datetime import datetime
 
+from ..const import MISSION_COMPLETION_EVENT
 from ..utils import download_file
 
 _LOGGER = logging.getLogger(__name__)
@@ -81,8 +82,6 @@ class MissionCompletionEventHandler:
         Returns:
             True if event was handled successfully, False otherwise
         """
-        from ..const import MISSION_COMPLETION_EVENT
-        
         try:
             # Check if this is the mission completion event
             if not MISSION_COMPLETION_EVENT.matches(siid, eiid):
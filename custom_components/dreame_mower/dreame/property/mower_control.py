@@ -17,6 +17,8 @@ import logging
 from typing import Dict, Any
 from enum import Enum
 
+from ..const import MOWER_CONTROL_STATUS_PROPERTY
+
 _LOGGER = logging.getLogger(__name__)
 
 # Property name constants for notifications
@@ -35,15 +37,39 @@ class MowerControlAction(Enum):
     COMPLETED = "completed"
 
 
+# Status code to action lookup for 2:56 updates
+_STATUS_CODE_TO_ACTION: dict[int, MowerControlAction] = {
+    0: MowerControlAction.CONTINUE,
+    2: MowerControlAction.COMPLETED,
+    4: MowerControlAction.PAUSE,
+}
+
+
 class MowerControlStatusHandler:
     """Handler for mower control status property (2:56)."""
     
     def __init__(self) -> None:
         """Initialize mower control status handler."""
         self._action: MowerControlAction | None = None
+        self._action_value: str | None = None
+        self._is_paused: bool | None = None
+        self._is_continuing: bool | None = None
+        self._is_completed: bool | None = None
         self._status_code: int | None = None
         self._raw_status: list[list[int]] | None = None
     
+    def _set_action(self, action: MowerControlAction | None) -> None:
+        """Store the action along with its derived value and state flags."""
+        self._action = action
+        if action is None:
+            self._action_value = None
+            self._is_paused = self._is_continuing = self._is_completed = None
+        else:
+            self._action_value = action.value
+            self._is_paused = action is MowerControlAction.PAUSE
+            self._is_continuing = action is MowerControlAction.CONTINUE
+            self._is_completed = action is MowerControlAction.COMPLETED
+    
     def parse_value(self, value: Any) -> bool:
         """Parse mower control status value."""
         try:
@@ -59,12 +85,13 @@ class MowerControlStatusHandler:
             if not isinstance(status_array, list):
                 raise ValueError(f"Invalid status array format: {status_array}")
             
-            self._raw_status = status_array
+            # Copy only the entry in use so the decoded MQTT frame is not retained
+            self._raw_status = [list(entry) for entry in status_array[:1]]
             
             # Handle empty status array as valid case (no active control command)
             if len(status_array) == 0:
                 self._status_code = None
-                self._action = None
+                self._set_action(None)
                 return True
             
             # Get first status entry (assuming format [[x, y]])
@@ -77,32 +104,25 @@ class MowerControlStatusHandler:
             self._status_code = int(status_entry[1])
             
             # Determine action based on status code
-            if self._status_code == 0:
-                self._action = MowerControlAction.CONTINUE
-            elif self._status_code == 2:
-                self._action = MowerControlAction.COMPLETED
-            elif self._status_code == 4:
-                self._action = MowerControlAction.PAUSE
-            else:
+            action = _STATUS_CODE_TO_ACTION.get(self._status_code)
+            if action is None:
                 # Unknown status code - report as warning
                 _LOGGER.warning(
                     "Unknown mower control status code: %d in message %s",
                     self._status_code, self._raw_status
                 )
-                return False            
+                return False
+            self._set_action(action)
             return True
             
         except (KeyError, ValueError, TypeError, IndexError) as ex:
             _LOGGER.error("Failed to parse mower control status - invalid format: %s", ex)
             return False
-        except Exception as ex:
-            _LOGGER.error("Failed to parse mower control status: %s", ex)
-            return False
     
     def get_notification_data(self) -> Dict[str, Any]:
         """Get mower control notification data for Home Assistant."""
         return {
-            CONTROL_ACTION_FIELD: self._action.value if self._action else None,
+            CONTROL_ACTION_FIELD: self._action_value,
             CONTROL_STATUS_FIELD: self._status_code,
             CONTROL_VALUE_FIELD: self._raw_status,
         }
@@ -118,6 +138,11 @@ class MowerControlStatusHandler:
         """Return mower control action enum."""
         return self._action
     
+    @property
+    def action_value(self) -> str | None:
+        """Return mower control action string."""
+        return self._action_value
+    
     @property
     def raw_status(self) -> list[list[int]] | None:
         """Return raw status array."""
@@ -126,17 +151,17 @@ class MowerControlStatusHandler:
     @property
     def is_paused(self) -> bool | None:
         """Return True if mower is paused."""
-        return self._action == MowerControlAction.PAUSE if self._action else None
+        return self._is_paused
     
     @property
     def is_continuing(self) -> bool | None:
         """Return True if mower is continuing."""
-        return self._action == MowerControlAction.CONTINUE if self._action else None
+        return self._is_continuing
     
     @property
     def is_completed(self) -> bool | None:
         """Return True if mower has completed/stopped."""
-        return self._action == MowerControlAction.COMPLETED if self._action else None
+        return self._is_completed
 
 
 class MowerControlPropertyHandler:
@@ -149,6 +174,7 @@ class MowerControlPropertyHandler:
         # State storage for mower control
         self._current_action: MowerControlAction | None = None
         self._last_status_code: int | None = None
+        self._has_status = False
     
     def handle_property_update(self, siid: int, piid: int, value: Any, notify_callback) -> bool:
         """Handle mower control property update.
@@ -164,19 +190,11 @@ class MowerControlPropertyHandler:
         Returns:
             True if property was handled successfully, False otherwise
         """
-        from ..const import MOWER_CONTROL_STATUS_PROPERTY
-        
-        try:
-            # Handle mower control status (2:56)
-            if MOWER_CONTROL_STATUS_PROPERTY.matches(siid, piid):
-                return self._handle_status_property(value, notify_callback)
-            else:
-                # Not a mower control property
-                return False
-                
-        except Exception as ex:
-            _LOGGER.error("Failed to handle mower control property %d:%d: %s", siid, piid, ex)
-            return False
+        # Handle mower control status (2:56)
+        if MOWER_CONTROL_STATUS_PROPERTY.matches(siid, piid):
+            return self._handle_status_property(value, notify_callback)
+        # Not a mower control property
+        return False
     
     def _handle_status_property(self, value: Any, notify_callback) -> bool:
         """Handle mower control status (2:56)."""
@@ -189,13 +207,22 @@ class MowerControlPropertyHandler:
             self._current_action = self._status_handler.action
             self._last_status_code = self._status_handler.status_code
             
+            # 2:56 repeats the same status frequently; only notify on change
+            if (
+                self._has_status
+                and old_action == self._current_action
+                and old_status_code == self._last_status_code
+            ):
+                return True
+            self._has_status = True
+            
             # Send notification
             status_data = self._status_handler.get_notification_data()
             notify_callback(MOWER_CONTROL_STATUS_PROPERTY_NAME, status_data)
             
             # Notify individual state changes for backward compatibility
             if old_action != self._current_action:
-                notify_callback("mower_action", self._current_action.value if self._current_action else None)
+                notify_callback("mower_action", self._status_handler.action_value)
             if old_status_code != self._last_status_code:
                 notify_callback("mower_status_code", self._last_status_code)
             
@@ -218,14 +245,14 @@ class MowerControlPropertyHandler:
     @property
     def is_paused(self) -> bool | None:
         """Return True if mower is currently paused."""
-        return self._current_action == MowerControlAction.PAUSE if self._current_action else None
+        return self._status_handler.is_paused
     
     @property
     def is_continuing(self) -> bool | None:
         """Return True if mower is currently continuing."""
-        return self._current_action == MowerControlAction.CONTINUE if self._current_action else None
+        return self._status_handler.is_continuing
     
     @property
     def is_completed(self) -> bool | None:
         """Return True if mower has completed/stopped."""
-        return self._current_action == MowerControlAction.COMPLETED if self._current_action else None
\ No newline at end of file
+        return self._status_handler.is_completed
\ No newline at end of file
@@ -9,6 +9,10 @@ The property can contain two different data formats:
 1. Full mowing data (33-byte payload) - sent regularly during mowing sessions
 2. Shorter format (8-byte payload) - unknown purpose, less common
 
+Frames are preferably passed as bytes, bytearray or memoryview and decoded in
+place. The list of ints produced by JSON-decoded MQTT messages is still
+accepted and converted to bytes once on entry.
+
 Based on analysis from dev/analyses/README_property_1_4.md and dev/analyze_property_1_4.py
 """
 
@@ -16,13 +20,19 @@ from __future__ import annotations
 
 import logging
 import struct
-from typing import Dict, Any, List
+from collections import deque
+from typing import Dict, Any, List, NamedTuple
 
 _LOGGER = logging.getLogger(__name__)
 
 # Property name constants for notifications
 POSE_COVERAGE_PROGRESS_PROPERTY_NAME = "mowing_progress"
 POSE_COVERAGE_COORDINATES_PROPERTY_NAME = "mowing_coordinates"
+POSE_COVERAGE_BUNDLE_PROPERTY_NAME = "mowing_pose_coverage"
+
+# Bundle notification field constants
+BUNDLE_PROGRESS_FIELD = "progress"
+BUNDLE_COORDINATES_FIELD = "coordinates"
 
 # Progress data field constants
 PROGRESS_CURRENT_AREA_FIELD = "current_area_sqm"
@@ -40,20 +50,48 @@ SENTINEL_BYTE = 206  # 0xCE - frame delimiter
 FULL_PAYLOAD_LENGTH = 31  # Expected payload length for full format
 SHORT_PAYLOAD_LENGTH = 6   # Expected payload length for short format
 
-# Byte positions in payload (0-indexed)
-X_POSITION = (0, 1)      # int16 LE - X coordinate
-Y_POSITION = (2, 3)      # int16 LE - Y coordinate  
-HEADING_POSITION = (6, 7) # int16 LE - Heading/state
-SEGMENT_POSITION = (22, 23) # uint16 - Segment/lane index
-CURRENT_AREA_POSITION = (28, 29) # uint16 - Current area (centi-sqm)
-TOTAL_AREA_POSITION = (25, 26)   # uint16 - Total area (centi-sqm)
+# Payload layouts decoded in a single call, read from offset 1 past the start
+# sentinel. Full format byte offsets (0-indexed): x 0-1, y 2-3, heading 6-7
+# (int16 LE), segment 22-23, total area 25-26, current area 28-29 (uint16 LE,
+# areas in centi-sqm)
+_FULL_FORMAT = struct.Struct("<hh2xh14xHxHxH")
+_SHORT_FORMAT = struct.Struct("<hh")
+
+# Number of recent points kept in the path history
+_PATH_HISTORY_LIMIT = 1000
+
+
+class _PathPoint(NamedTuple):
+    """Compact path history entry, expanded to a dict when read."""
+    x: int
+    y: int
+    heading: int
+    segment: int
+    timestamp: float | None = None  # Will be added by caller if available
 
 
 class PoseCoverageHandler:
     """Handler for pose and coverage telemetry property (1:4)."""
     
-    def __init__(self) -> None:
-        """Initialize pose coverage handler."""
+    __slots__ = (
+        "_current_area_sqm",
+        "_heading",
+        "_last_frame",
+        "_mission_completed",
+        "_path_history",
+        "_progress_percent",
+        "_segment",
+        "_total_area_sqm",
+        "_x_coordinate",
+        "_y_coordinate",
+    )
+    
+    def __init__(self, path_history: bool = True) -> None:
+        """Initialize pose coverage handler.
+        
+        Args:
+            path_history: Record recent positions for visualization
+        """
         # Progress tracking
         self._current_area_sqm: float | None = None
         self._total_area_sqm: float | None = None
@@ -66,17 +104,28 @@ class PoseCoverageHandler:
         self._segment: int | None = None
         self._heading: int | None = None
         
-        # Path history for visualization
-        self._path_history: List[Dict[str, Any]] = []
+        # Path history for visualization, None when disabled
+        self._path_history: deque[_PathPoint] | None = (
+            deque(maxlen=_PATH_HISTORY_LIMIT) if path_history else None
+        )
+        
+        # Last successfully parsed frame, used to skip identical repeats
+        self._last_frame: bytes | None = None
     
-    def parse_value(self, value: Any) -> bool:
-        """Parse pose coverage value from binary array."""
+    def parse_value(self, value: bytes | bytearray | memoryview | List[int]) -> bool:
+        """Parse pose coverage value from a binary frame or list of byte values."""
         try:
-            # Ensure we have a list of integers (byte array)
-            if not isinstance(value, list):
+            # Byte buffers are decoded in place; lists are converted once
+            if isinstance(value, list):
+                value = bytes(value)
+            elif not isinstance(value, (bytes, bytearray, memoryview)):
                 _LOGGER.warning("Invalid pose coverage value type: %s", type(value))
                 return False
             
+            # A stationary mower repeats the same frame; nothing would change
+            if value == self._last_frame:
+                return True
+            
             if len(value) < 8:
                 _LOGGER.warning("Pose coverage payload too short: %d bytes", len(value))
                 return False
@@ -87,50 +136,44 @@ class PoseCoverageHandler:
                               value[0], value[-1])
                 return False
             
-            # Extract payload (remove sentinel bytes)
-            payload = value[1:-1]
-            payload_length = len(payload)
+            # Payload excludes the two sentinel bytes
+            payload_length = len(value) - 2
             
-            if payload_length == FULL_PAYLOAD_LENGTH:
-                return self._parse_full_format(payload)
-            elif payload_length == SHORT_PAYLOAD_LENGTH:
-                return self._parse_short_format(payload)
-            else:
+            parser = _PARSERS_BY_PAYLOAD_LENGTH.get(payload_length)
+            if parser is None:
                 _LOGGER.warning("Unknown pose coverage payload length: %d bytes", payload_length)
                 return False
+            if not parser(self, value):
+                return False
+            self._last_frame = bytes(value)
+            return True
                 
         except Exception as ex:
             _LOGGER.error("Failed to parse pose coverage data: %s", ex)
             return False
     
-    def _parse_full_format(self, payload: List[int]) -> bool:
+    def _parse_full_format(self, frame: bytes | bytearray | memoryview) -> bool:
         """Parse full format (31-byte payload) with complete mowing data."""
         try:
-            # Extract coordinates (int16 little-endian)
-            x = self._read_int16_le(payload, X_POSITION[0])
-            y = self._read_int16_le(payload, Y_POSITION[0])
-            
-            # Extract heading/state
-            heading = self._read_int16_le(payload, HEADING_POSITION[0])
-            
-            # Extract segment information
-            segment = self._read_uint16_le(payload, SEGMENT_POSITION[0])
-            
-            # Extract area information (convert from centi-sqm to sqm)
-            current_area_centisqm = self._read_uint16_le(payload, CURRENT_AREA_POSITION[0])
-            total_area_centisqm = self._read_uint16_le(payload, TOTAL_AREA_POSITION[0])
+            # Coordinates and heading are int16 LE, segment and areas uint16 LE
+            x, y, heading, segment, total_area_centisqm, current_area_centisqm = (
+                _FULL_FORMAT.unpack_from(frame, 1)
+            )
             
+            # Convert area information from centi-sqm to sqm
             current_area_sqm = current_area_centisqm / 100.0
             total_area_sqm = total_area_centisqm / 100.0
             
-            # Calculate progress percentage
-            progress_percent = 0.0
-            if total_area_sqm > 0:
-                progress_percent = min(100.0, (current_area_sqm / total_area_sqm) * 100.0)
-            
-            # If mission is marked as completed, cap progress at 100%
-            if self._mission_completed and progress_percent > 0:
+            # Calculate progress percentage from the raw areas; once the mission
+            # is marked as completed any progress is reported as 100%
+            if not total_area_centisqm:
+                progress_percent = 0.0
+            elif current_area_centisqm >= total_area_centisqm or (
+                self._mission_completed and current_area_centisqm
+            ):
                 progress_percent = 100.0
+            else:
+                progress_percent = current_area_centisqm * 100.0 / total_area_centisqm
             
             # Update state
             self._x_coordinate = x
@@ -141,17 +184,13 @@ class PoseCoverageHandler:
             self._total_area_sqm = total_area_sqm
             self._progress_percent = progress_percent
             
-            # Add to path history (keep last 1000 points to avoid memory issues)
-            path_point = {
-                "x": x,
-                "y": y,
-                "heading": heading,
-                "segment": segment,
-                "timestamp": None  # Will be added by caller if available
-            }
-            self._path_history.append(path_point)
-            if len(self._path_history) > 1000:
-                self._path_history.pop(0)
+            # Add to path history unless the mower has not moved; the deque
+            # drops the oldest point once full
+            history = self._path_history
+            if history is not None:
+                point = _PathPoint(x, y, heading, segment)
+                if not history or history[-1] != point:
+                    history.append(point)
             
             return True
             
@@ -159,13 +198,12 @@ class PoseCoverageHandler:
             _LOGGER.error("Failed to parse full format pose coverage: %s", ex)
             return False
     
-    def _parse_short_format(self, payload: List[int]) -> bool:
+    def _parse_short_format(self, frame: bytes | bytearray | memoryview) -> bool:
         """Parse short format (6-byte payload) with limited data."""
         try:
             # For now, just extract coordinates from short format
             # The meaning of other bytes is not yet understood
-            x = self._read_int16_le(payload, 0)
-            y = self._read_int16_le(payload, 2)
+            x, y = _SHORT_FORMAT.unpack_from(frame, 1)
             
             # Update coordinate state only
             self._x_coordinate = x
@@ -178,24 +216,6 @@ class PoseCoverageHandler:
             _LOGGER.error("Failed to parse short format pose coverage: %s", ex)
             return False
     
-    def _read_int16_le(self, payload: List[int], offset: int) -> int:
-        """Read 16-bit signed integer in little-endian format."""
-        if offset + 1 >= len(payload):
-            raise ValueError(f"Payload too short for int16 at offset {offset}")
-        
-        # Pack bytes and unpack as little-endian signed short
-        bytes_data = bytes([payload[offset], payload[offset + 1]])
-        return struct.unpack('<h', bytes_data)[0]
-    
-    def _read_uint16_le(self, payload: List[int], offset: int) -> int:
-        """Read 16-bit unsigned integer in little-endian format."""
-        if offset + 1 >= len(payload):
-            raise ValueError(f"Payload too short for uint16 at offset {offset}")
-        
-        # Pack bytes and unpack as little-endian unsigned short  
-        bytes_data = bytes([payload[offset], payload[offset + 1]])
-        return struct.unpack('<H', bytes_data)[0]
-    
     def get_progress_notification_data(self) -> Dict[str, Any]:
         """Get progress notification data for Home Assistant."""
         return {
@@ -252,11 +272,15 @@ class PoseCoverageHandler:
     @property
     def path_history(self) -> List[Dict[str, Any]]:
         """Return path history for visualization."""
-        return self._path_history.copy()
+        if self._path_history is None:
+            return []
+        return [point._asdict() for point in self._path_history]
     
     def clear_path_history(self) -> None:
         """Clear the path history (e.g., when a new mowing session starts)."""
-        self._path_history.clear()
+        if self._path_history is not None:
+            self._path_history.clear()
+        self._last_frame = None
         _LOGGER.debug("Path history cleared")
     
     def mark_mission_completed(self) -> None:
@@ -278,8 +302,16 @@ class PoseCoverageHandler:
         Called when a new mowing session starts to allow normal progress tracking.
         """
         self._mission_completed = False
+        # Progress of a repeated frame must be recomputed without the cap
+        self._last_frame = None
         _LOGGER.debug("Mission completion flag reset")
 
 
+# Format parsers keyed by payload length (frame length minus both sentinels)
+_PARSERS_BY_PAYLOAD_LENGTH = {
+    FULL_PAYLOAD_LENGTH: PoseCoverageHandler._parse_full_format,
+    SHORT_PAYLOAD_LENGTH: PoseCoverageHandler._parse_short_format,
+}
+
 # Unified property handler combining both functionalities
 PoseCoveragePropertyHandler = PoseCoverageHandler
\ No newline at end of file
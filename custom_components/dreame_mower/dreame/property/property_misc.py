@@ -9,11 +9,14 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 from ..const import PROPERTY_1_1, SETTINGS_CHANGE_PROPERTY
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISC_PROPERTY_KEYS = frozenset({PROPERTY_1_1.key, SETTINGS_CHANGE_PROPERTY.key})
+
 
 class Property11Handler:
     """Handler for property 1:1 - complex status/telemetry data.
@@ -74,6 +77,8 @@ class SettingsChangeHandler:
     tied to any specific feature.
     """
     
+    __slots__ = ("_last_value",)
+    
     def __init__(self) -> None:
         """Initialize settings change handler."""
         self._last_value: dict[str, Any] | None = None
@@ -87,8 +92,10 @@ class SettingsChangeHandler:
             
             self._last_value = value
             
-            # Log the settings change as info with JSON content
-            _LOGGER.info("Settings change acknowledged (2:51): %s", json.dumps(value))
+            # Log the settings change as info with JSON content, serializing
+            # only when the record would actually be emitted
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("Settings change acknowledged (2:51): %s", json.dumps(value))
             return True
                 
         except Exception as ex:
@@ -96,9 +103,9 @@ class SettingsChangeHandler:
             return False
     
     @property
-    def last_value(self) -> dict[str, Any] | None:
-        """Return last received settings change data."""
-        return self._last_value.copy() if self._last_value else None
+    def last_value(self) -> Mapping[str, Any] | None:
+        """Return a read-only view of the last received settings change data."""
+        return MappingProxyType(self._last_value) if self._last_value else None
 
 
 class MiscPropertyHandler:
@@ -112,7 +119,7 @@ class MiscPropertyHandler:
     @staticmethod
     def matches(siid: int, piid: int) -> bool:
         """Check if a property is a miscellaneous property."""
-        return PROPERTY_1_1.matches(siid, piid) or SETTINGS_CHANGE_PROPERTY.matches(siid, piid)
+        return (siid, piid) in _MISC_PROPERTY_KEYS
     
     def handle_property_update(self, siid: int, piid: int, value: Any, notify_callback: Callable[[str, Any], None]) -> bool:
         """Handle miscellaneous property updates."""
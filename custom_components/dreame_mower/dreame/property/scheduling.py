@@ -10,7 +10,8 @@ These properties manage mission lifecycle and completion tracking.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping
 from enum import Enum
 from ..const import SCHEDULING_TASK_PROPERTY, SCHEDULING_SUMMARY_PROPERTY
 
@@ -32,18 +33,44 @@ class TaskType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Task type lookup by the raw 't' field value
+_TASK_TYPE_BY_STR: dict[str, TaskType] = {task_type.value: task_type for task_type in TaskType}
+
+
 class TaskHandler:
     """Handler for mission task descriptor property (2:50)."""
     
+    __slots__ = (
+        "_area_id",
+        "_coverage_target",
+        "_elapsed_time",
+        "_execution_active",
+        "_notification_data",
+        "_region_id",
+        "_task_active",
+        "_task_type",
+        "_task_type_value",
+    )
+    
     def __init__(self) -> None:
         """Initialize task handler."""
         self._task_type: TaskType | None = None
+        self._task_type_value: str | None = None
         self._area_id: list[int] | None = None
         self._execution_active: bool | None = None
         self._coverage_target: int | None = None
         self._region_id: list[int] | None = None
         self._task_active: bool | None = None
         self._elapsed_time: int | None = None
+        self._notification_data: Dict[str, Any] = dict.fromkeys((
+            TASK_TYPE_FIELD,
+            TASK_AREA_ID_FIELD,
+            TASK_EXECUTION_FIELD,
+            TASK_COVERAGE_FIELD,
+            TASK_REGION_ID_FIELD,
+            TASK_STATUS_FIELD,
+            TASK_TIME_FIELD,
+        ))
     
     def parse_value(self, value: Any) -> bool:
         """Parse task descriptor value."""
@@ -53,8 +80,8 @@ class TaskHandler:
                 return False
             
             # Extract task type - required field
-            task_type_str = value["t"]
-            self._task_type = TaskType.TASK if task_type_str == "TASK" else TaskType.UNKNOWN
+            task_type = _TASK_TYPE_BY_STR.get(value["t"], TaskType.UNKNOWN)
+            task_type_value = task_type.value
             
             # Extract task data from 'd' field - required
             task_data = value["d"]
@@ -62,18 +89,38 @@ class TaskHandler:
                 raise ValueError(f"Invalid task data format: {task_data}")
             
             # Extract required task fields - let KeyError bubble up for missing required fields
-            self._execution_active = task_data["exe"]
-            self._coverage_target = task_data["o"]
-            self._task_active = task_data["status"]
+            execution_active = task_data["exe"]
+            coverage_target = task_data["o"]
+            task_active = task_data["status"]
             
             # Extract optional task fields (may not be present for paused/docked states)
-            self._area_id = task_data.get("area_id")
-            self._region_id = task_data.get("region_id")
-            self._elapsed_time = task_data.get("time")
+            area_id = task_data.get("area_id")
+            region_id = task_data.get("region_id")
+            elapsed_time = task_data.get("time")
+            
+            self._task_type = task_type
+            self._task_type_value = task_type_value
+            self._area_id = area_id
+            self._execution_active = execution_active
+            self._coverage_target = coverage_target
+            self._region_id = region_id
+            self._task_active = task_active
+            self._elapsed_time = elapsed_time
+            
+            # Build the notification payload once while the fields are at hand
+            self._notification_data = {
+                TASK_TYPE_FIELD: task_type_value,
+                TASK_AREA_ID_FIELD: area_id,
+                TASK_EXECUTION_FIELD: execution_active,
+                TASK_COVERAGE_FIELD: coverage_target,
+                TASK_REGION_ID_FIELD: region_id,
+                TASK_STATUS_FIELD: task_active,
+                TASK_TIME_FIELD: elapsed_time,
+            }
             
             _LOGGER.debug(
                 "Task descriptor parsed: type=%s, regions=%s, elapsed=%s, active=%s, execution_active=%s",
-                self._task_type, self._region_id, self._elapsed_time, self._task_active, self._execution_active
+                task_type, region_id, elapsed_time, task_active, execution_active
             )
             return True
             
@@ -85,16 +132,12 @@ class TaskHandler:
             return False
     
     def get_notification_data(self) -> Dict[str, Any]:
-        """Get task notification data for Home Assistant."""
-        return {
-            TASK_TYPE_FIELD: self._task_type.value if self._task_type else None,
-            TASK_AREA_ID_FIELD: self._area_id,
-            TASK_EXECUTION_FIELD: self._execution_active,
-            TASK_COVERAGE_FIELD: self._coverage_target,
-            TASK_REGION_ID_FIELD: self._region_id,
-            TASK_STATUS_FIELD: self._task_active,
-            TASK_TIME_FIELD: self._elapsed_time,
-        }
+        """Get task notification data for Home Assistant.
+        
+        The payload is rebuilt on every successful parse, so callers must
+        treat it as read-only.
+        """
+        return self._notification_data
     
     # Properties for direct access
     @property
@@ -136,6 +179,8 @@ class TaskHandler:
 class SummaryHandler:
     """Handler for mission completion summary property (2:52)."""
     
+    __slots__ = ("_summary_data",)
+    
     def __init__(self) -> None:
         """Initialize summary handler."""
         self._summary_data: Dict[str, Any] = {}
@@ -165,9 +210,9 @@ class SummaryHandler:
         return self._summary_data.copy()
     
     @property
-    def summary_data(self) -> Dict[str, Any]:
-        """Return raw summary data."""
-        return self._summary_data.copy()
+    def summary_data(self) -> Mapping[str, Any]:
+        """Return a read-only view of the raw summary data."""
+        return MappingProxyType(self._summary_data)
     
     @property
     def is_empty(self) -> bool:
@@ -178,26 +223,32 @@ class SummaryHandler:
 class SchedulingPropertyHandler:
     """Combined handler for scheduling properties (2:50, 2:52)."""
     
+    __slots__ = ("_dispatch", "_summary_handler", "_task_handler")
+    
     def __init__(self) -> None:
         """Initialize scheduling property handler."""
         self._task_handler = TaskHandler()
         self._summary_handler = SummaryHandler()
+        self._dispatch: dict[tuple[int, int], Callable[[Any, Callable[[str, Any], None]], bool]] = {
+            SCHEDULING_TASK_PROPERTY.key: self._handle_task_property,
+            SCHEDULING_SUMMARY_PROPERTY.key: self._handle_summary_property,
+        }
+
+    @property
+    def task_handler(self) -> TaskHandler:
+        """Return the handler holding the current task descriptor."""
+        return self._task_handler
     
     def handle_property_update(self, siid: int, piid: int, value: Any, notify_callback) -> bool:
         """Handle scheduling property update with unified logic."""
+        # Task descriptor (2:50) or summary (2:52)
+        handler = self._dispatch.get((siid, piid))
+        if handler is None:
+            # Not a scheduling property
+            return False
+        
         try:
-            # Handle task descriptor (2:50)
-            if SCHEDULING_TASK_PROPERTY.matches(siid, piid):
-                return self._handle_task_property(value, notify_callback)
-            
-            # Handle summary (2:52)
-            elif SCHEDULING_SUMMARY_PROPERTY.matches(siid, piid):
-                return self._handle_summary_property(value, notify_callback)
-            
-            else:
-                # Not a scheduling property
-                return False
-                
+            return handler(value, notify_callback)
         except Exception as ex:
             _LOGGER.error("Failed to handle scheduling property %d:%d: %s", siid, piid, ex)
             return False
@@ -5,8 +5,9 @@ for better quality and HAOS compatibility.
 """
 
 import logging
+import os
 from typing import Any, Dict, List, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,9 @@ COLORS_SVG = {
 # Live coordinate scaling factor
 LIVE_Y_COORDINATE_SCALE_FACTOR = 16.0
 
+# Coordinate value (INT32 max) marking a break between path segments
+PATH_BREAK_SENTINEL = 2147483647
+
 
 def calculate_bounds(all_points: List[List[int]]) -> Tuple[int, int, int, int]:
     """Calculate the bounding box for all coordinate points.
@@ -50,7 +54,7 @@ def calculate_bounds(all_points: List[List[int]]) -> Tuple[int, int, int, int]:
     if not all_points:
         return 0, 0, 100, 100
     
-    valid_points = [p for p in all_points if p[0] != 2147483647 and p[1] != 2147483647]
+    valid_points = [p for p in all_points if p[0] != PATH_BREAK_SENTINEL and p[1] != PATH_BREAK_SENTINEL]
     if not valid_points:
         return 0, 0, 100, 100
     
@@ -430,7 +434,7 @@ def generate_svg_map_image(data: Dict[str, Any], historical_file_path: str | Non
                 # Parse main mowing path from "data" - split by sentinel values within each item
                 current_segment: List[List[int]] = []
                 for point in item_data:
-                    if point[0] == 2147483647 and point[1] == 2147483647:
+                    if point[0] == PATH_BREAK_SENTINEL and point[1] == PATH_BREAK_SENTINEL:
                         if len(current_segment) > 1:
                             segments.append(current_segment)
                         current_segment = []
@@ -442,7 +446,7 @@ def generate_svg_map_image(data: Dict[str, Any], historical_file_path: str | Non
                 # Parse additional path from "track" - split by sentinel values within each item
                 current_track_segment: List[List[int]] = []
                 for point in item_track:
-                    if point[0] == 2147483647 and point[1] == 2147483647:
+                    if point[0] == PATH_BREAK_SENTINEL and point[1] == PATH_BREAK_SENTINEL:
                         if len(current_track_segment) > 1:
                             track_segments.append(current_track_segment)
                         current_track_segment = []
@@ -528,7 +532,6 @@ def generate_svg_map_image(data: Dict[str, Any], historical_file_path: str | Non
                 svg_lines.append('</g>')
         
         # Draw title (outside rotation group)
-        import os
         if historical_file_path:
             title = f"Dreame Mower Map (Historical: {os.path.basename(historical_file_path)})"
         else:
@@ -563,7 +566,6 @@ def generate_svg_map_image(data: Dict[str, Any], historical_file_path: str | Non
         start_timestamp = data.get("start")
         if start_timestamp:
             # Use UTC to ensure consistent timestamps across different timezones
-            from datetime import timezone
             timestamp = datetime.fromtimestamp(start_timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
             timestamp_text = f"Started: {timestamp}"
         else:
@@ -55,7 +55,9 @@ class DreameMowerLawnMower(DreameMowerEntity, LawnMowerEntity):
         self._attr_name = None  # Fix "A2 None" issue - set explicit name to None so HA uses just device name
 
         # Register listener for status changes
-        self.coordinator.device.register_property_callback(self._on_property_change)
+        self._property_callback_handle = self.coordinator.device.register_property_callback(
+            self._on_property_change, (STATUS_PROPERTY.name,)
+        )
         
         # Initialize activity based on current device status
         self._initialize_activity()
@@ -82,6 +84,11 @@ class DreameMowerLawnMower(DreameMowerEntity, LawnMowerEntity):
             return None
         return self._attr_activity
     
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop listening for device status changes."""
+        self.coordinator.device.unregister_property_callback(self._property_callback_handle)
+        await super().async_will_remove_from_hass()
+
     def _on_property_change(self, property_name: str, value: Any) -> None:
         """Handle property changes from the device."""
         if property_name == STATUS_PROPERTY.name:
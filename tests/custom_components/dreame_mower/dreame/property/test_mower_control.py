@@ -229,6 +229,20 @@ class TestMowerControlPropertyHandler:
         assert self.handler.is_continuing is False
         assert self.handler.is_completed is False
 
+    def test_repeated_status_notified_once(self):
+        """Test an unchanged status is not re-notified."""
+        self.handler.handle_property_update(2, 56, {'status': [[1, 4]]}, self.notify_callback)
+        self.notify_callback.reset_mock()
+
+        result = self.handler.handle_property_update(2, 56, {'status': [[1, 4]]}, self.notify_callback)
+
+        assert result is True
+        self.notify_callback.assert_not_called()
+
+        self.handler.handle_property_update(2, 56, {'status': [[1, 0]]}, self.notify_callback)
+        notified = [call[0][0] for call in self.notify_callback.call_args_list]
+        assert MOWER_CONTROL_STATUS_PROPERTY_NAME in notified
+
     def test_handle_unrecognized_property(self):
         """Test handling unrecognized property returns False."""
         # Different property that shouldn't be handled
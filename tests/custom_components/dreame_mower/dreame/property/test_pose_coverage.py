@@ -248,6 +248,18 @@ def test_parse_short_format_unaffected_by_completion_flag(handler):
     assert handler.progress_percent is None
 
 
+def test_parse_accepts_byte_buffers(handler):
+    """Test bytes and memoryview frames parse the same as a list of ints."""
+    frame = bytes([0xCE, 0x9C, 0xFF, 200, 0, 50, 0, 0xCE])  # X = -100
+
+    assert handler.parse_value(frame) is True
+    assert handler.x_coordinate == -100
+    assert handler.y_coordinate == 200
+
+    assert handler.parse_value(memoryview(bytearray(frame))) is True
+    assert handler.x_coordinate == -100
+
+
 def test_progress_notification_data(handler):
     """Test getting progress notification data."""
     # Parse some progress
@@ -296,3 +308,41 @@ def test_progress_percent_capped_at_100_even_if_calculation_exceeds(handler):
     
     # Should be capped at 100%, not 1000%
     assert handler.progress_percent == 100.0
+
+
+def test_path_history_bounded_and_returned_as_dicts(handler):
+    """Test path history keeps the latest points and exposes them as dicts."""
+    for x in range(1005):
+        frame = bytearray(33)
+        frame[0] = frame[-1] = 0xCE
+        frame[1:3] = x.to_bytes(2, "little")
+        handler.parse_value(frame)
+
+    history = handler.path_history
+
+    assert len(history) == 1000
+    assert history[0] == {"x": 5, "y": 0, "heading": 0, "segment": 0, "timestamp": None}
+    assert history[-1]["x"] == 1004
+
+
+def test_repeated_frame_skips_history_append(handler):
+    """Test an identical frame is accepted without adding a duplicate path point."""
+    frame = [0xCE, 100, 0, 200, 0] + [0] * 27 + [0xCE]
+
+    assert handler.parse_value(frame) is True
+    assert handler.parse_value(frame) is True
+    assert handler.parse_value(bytes(frame)) is True
+
+    assert len(handler.path_history) == 1
+    assert handler.x_coordinate == 100
+
+
+def test_path_history_disabled():
+    """Test a handler without path history still tracks the current pose."""
+    handler = PoseCoverageHandler(path_history=False)
+    frame = [0xCE, 100, 0, 200, 0] + [0] * 27 + [0xCE]
+
+    assert handler.parse_value(frame) is True
+    assert handler.x_coordinate == 100
+    assert handler.path_history == []
+    handler.clear_path_history()
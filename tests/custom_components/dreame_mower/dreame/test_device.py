@@ -1,8 +1,10 @@
 """Basic tests for the DreameMowerDevice class."""
 
 import asyncio
+import threading
+import time
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch, PropertyMock
 
 from custom_components.dreame_mower.dreame.device import DreameMowerDevice
@@ -79,9 +81,26 @@ class MockCloudDevice:
         return self.action(action.siid, action.aiid)
 
 
+def _release_device_threads(device):
+    """Shut down the device's background threads so none outlive the test."""
+    worker = device._stop_inbox_worker()
+    if worker is not None:
+        worker.join(timeout=5)
+    executor, device._cloud_executor = device._cloud_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
 @pytest.fixture
 def device():
     """Create a basic device instance for testing."""
+    device = _create_device()
+    yield device
+    _release_device_threads(device)
+
+
+def _create_device():
+    """Create a device backed by the mock cloud device."""
     with patch('custom_components.dreame_mower.dreame.device.DreameMowerCloudDevice') as mock_cloud_device_class:
         with patch('custom_components.dreame_mower.dreame.utils.requests') as mock_requests:
             with patch('custom_components.dreame_mower.dreame.utils.os.makedirs') as mock_makedirs:
@@ -156,6 +175,78 @@ def test_register_property_callback(device):
     assert callback_called[0] == ("test_prop", "test_value")
 
 
+def test_unregister_property_callback(device):
+    """Test callbacks stop receiving changes once unregistered by handle."""
+    changes = []
+    handle = device.register_property_callback(lambda name, value: changes.append(name))
+    named_handle = device.register_property_callback(lambda name, value: changes.append(name), ["status"])
+    assert handle != named_handle
+
+    device.unregister_property_callback(handle)
+    device.unregister_property_callback(named_handle)
+    device._notify_property_change("status", 1)
+
+    assert changes == []
+
+
+def test_pose_payloads_not_built_without_listeners(device):
+    """Test pose coverage notification payloads are skipped when nobody listens."""
+    handler_class = type(device._pose_coverage_handler)
+    with patch.object(handler_class, 'parse_value', return_value=True), \
+         patch.object(handler_class, 'get_progress_notification_data') as mock_progress:
+        assert device._handle_mqtt_property_update({'siid': 1, 'piid': 4, 'value': []}) is True
+        mock_progress.assert_not_called()
+
+        device.register_property_callback(lambda name, value: None, ["mowing_pose_coverage"])
+        device._handle_mqtt_property_update({'siid': 1, 'piid': 4, 'value': []})
+        mock_progress.assert_called_once()
+
+
+def test_property_callback_names_filter(device):
+    """Test callbacks registered for specific names only receive those properties."""
+    all_changes = []
+    status_changes = []
+    device.register_property_callback(lambda name, value: all_changes.append(name))
+    device.register_property_callback(lambda name, value: status_changes.append(value), ["status"])
+
+    device._handle_message({'method': 'properties_changed', 'params': [{'siid': 3, 'piid': 1, 'value': 50}]})
+    device._handle_message({'method': 'properties_changed', 'params': [{'siid': 2, 'piid': 1, 'value': 1}]})
+
+    assert all_changes == ["battery_percent", "status"]
+    assert status_changes == [1]
+
+
+def test_notifications_flushed_after_message(device):
+    """Test notifications raised while handling a message are delivered after it."""
+    changes = []
+    device.register_property_callback(lambda name, value: changes.append((name, value)))
+
+    with patch.object(DreameMowerDevice, '_process_message',
+                      side_effect=lambda message: (device._notify_property_change("activity", "a"),
+                                                   device._notify_property_change("activity", "b"),
+                                                   changes.append(("processed", None)))):
+        device._handle_message({'method': 'props', 'params': {}})
+
+    assert changes == [("processed", None), ("activity", "b")]
+
+
+@pytest.mark.asyncio
+async def test_async_property_callback_scheduled_on_loop(device):
+    """Test coroutine callbacks are scheduled as tasks on the registering loop."""
+    changes = []
+
+    async def async_callback(name, value):
+        changes.append((name, value))
+
+    device.register_property_callback(async_callback)
+    device._notify_property_change("activity", "mowing")
+    assert changes == []
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert changes == [("activity", "mowing")]
+
+
 @pytest.mark.asyncio
 async def test_connect(device):
     """Test device connection."""
@@ -182,6 +273,34 @@ async def test_disconnect(device):
     # This tests the disconnect method runs without errors
 
 
+@pytest.mark.asyncio
+async def test_reconnect_after_disconnect(device):
+    """Test cloud calls keep working after a disconnect and reconnect."""
+    device._cloud_device.set_connected_state(True)
+    await device.connect()
+    await device.disconnect()
+
+    assert await device.connect() is True
+    assert await device.start_mowing() is True
+
+
+@pytest.mark.asyncio
+async def test_disconnect_joins_inbox_worker(device):
+    """Test disconnect waits for the inbox worker thread to exit."""
+    device._cloud_device.set_connected_state(True)
+    await device.connect()
+    worker = device._inbox_worker
+    assert worker.is_alive()
+
+    # Keep the worker busy so only a real join sees it finish
+    with patch.object(DreameMowerDevice, '_process_message', lambda self, message: time.sleep(0.2)):
+        device._enqueue_message({'method': 'properties_changed', 'params': []})
+        await device.disconnect()
+
+    assert not worker.is_alive()
+    assert device._inbox_worker is None
+
+
 @pytest.mark.asyncio
 async def test_start_mowing_when_connected(device):
     """Test start mowing when device is connected."""
@@ -222,13 +341,22 @@ async def test_return_to_dock_when_connected(device):
     device._cloud_device.set_connected_state(True)
     await device.connect()
     
-    # Patch the internal mission_completed_event.wait coroutine so the
+    # Resolve the mission completion wait as soon as STOP is sent so the
     # return_to_dock sequence does not actually wait up to 30 seconds.
-    # (Patching asyncio.wait_for directly previously caused an un-awaited
-    # Event.wait() coroutine warning when raising TimeoutError immediately.)
-    with patch.object(device._mission_completed_event, "wait", new=AsyncMock(return_value=True)):
+    execute_action = device._cloud_device.execute_action
+
+    def stop_then_complete(action):
+        result = execute_action(action)
+        if device._mission_completed_fut is not None:
+            device._mission_completed_fut.get_loop().call_soon_threadsafe(
+                device._resolve_mission_completed, device._mission_completed_fut
+            )
+        return result
+
+    with patch.object(device._cloud_device, "execute_action", side_effect=stop_then_complete):
         result = await device.return_to_dock()
         assert result is True
+    assert device._mission_completed_fut is None
 
 
 @pytest.mark.asyncio
@@ -238,6 +366,37 @@ async def test_return_to_dock_when_disconnected(device):
     assert result is False
 
 
+def test_restarted_inbox_worker_not_stopped_by_old_sentinel(device):
+    """Test a worker started while the old one is still busy keeps handling messages."""
+    release = threading.Event()
+    busy = threading.Event()
+    process_message = DreameMowerDevice._process_message
+
+    def slow_first_message(self, message):
+        if message.get('slow'):
+            busy.set()
+            release.wait(timeout=5)
+            return
+        process_message(self, message)
+
+    with patch.object(DreameMowerDevice, '_process_message', slow_first_message):
+        device._start_inbox_worker()
+        old_worker = device._inbox_worker
+        device._enqueue_message({'slow': True})
+        busy.wait(timeout=5)
+        device._stop_inbox_worker()
+        device._start_inbox_worker()
+        new_worker = device._inbox_worker
+        release.set()
+        old_worker.join(timeout=5)
+
+        device._enqueue_message({'method': 'properties_changed', 'params': [{'siid': 3, 'piid': 1, 'value': 55}]})
+        device._stop_inbox_worker()
+        new_worker.join(timeout=5)
+
+    assert device.battery_percent == 55
+
+
 @pytest.mark.asyncio
 async def test_message_callback(device):
     """Test handling of incoming messages."""
@@ -273,7 +432,12 @@ async def test_message_callback(device):
     
     # Simulate MQTT message
     device._cloud_device.simulate_message(battery_message)
-    
+
+    # Messages are processed on the inbox worker; stopping it drains the queue first
+    worker = device._inbox_worker
+    device._stop_inbox_worker()
+    worker.join(timeout=5)
+
     # Check battery was updated via MQTT
     assert device.battery_percent == 75
     
@@ -330,6 +494,25 @@ def test_service1_session_start_properties():
     assert device.service1_completion_flag is False
 
 
+@pytest.mark.asyncio
+async def test_service1_presence_flags_notify_again_after_reconnect(device):
+    """Test Service1 presence flags are cleared on disconnect and notify on the next session."""
+    property_changes = []
+    device.register_property_callback(lambda name, value: property_changes.append((name, value)))
+    message_property_50 = {
+        'method': 'properties_changed',
+        'params': [{'did': '-1******95', 'piid': 50, 'siid': 1}]
+    }
+
+    device._handle_message(message_property_50)
+    await device.disconnect()
+    assert device.service1_property_50 is False
+
+    device._handle_message(message_property_50)
+    assert device.service1_property_50 is True
+    assert property_changes.count(("service1_property_50", True)) == 2
+
+
 def test_handle_mqtt_props_success(device):
     """Test _handle_mqtt_props with known parameter (success case)."""
     # Track property changes
@@ -358,6 +541,33 @@ def test_handle_mqtt_props_failure(device):
     assert len(property_changes) == 0
 
 
+def test_unchanged_property_value_not_redispatched(device):
+    """Test a repeated change-only property value is dropped before dispatch."""
+    message = {'method': 'properties_changed', 'params': [{'siid': 3, 'piid': 1, 'value': 85}]}
+    device._handle_message(message)
+
+    with patch.object(DreameMowerDevice, '_handle_mqtt_property_update') as mock_update:
+        device._handle_message(message)
+        mock_update.assert_not_called()
+
+        # Cloud device info may change the battery, so the next repeat is dispatched again
+        device._update_device_state_from_info({"battery": 70})
+        device._handle_message(message)
+        mock_update.assert_called_once()
+
+
+def test_last_update_derived_from_monotonic_stamp(device):
+    """Test last_update is stable between messages and advances on a new message."""
+    first = device.last_update
+    assert device.last_update is first
+
+    with patch('custom_components.dreame_mower.dreame.device.time.monotonic',
+               return_value=device._monotonic_anchor + 5):
+        device._handle_message({'method': 'props', 'params': {'ota_state': 'idle'}})
+
+    assert device.last_update == device._wall_anchor + timedelta(seconds=5)
+
+
 def test_service2_property_62_handling(device):
     """Test Service 2 property 62 (2:62) handling."""
     # Track property changes
@@ -701,9 +911,15 @@ async def test_mission_completion_caps_progress_at_100_percent(device):
     }
     
     device._handle_message(progress_message)
-    
+
     # Verify progress is 96%
     assert device.mowing_progress_percent == 96.0
+
+    # Progress and coordinates arrive as a single bundled notification
+    assert [name for name, _ in property_changes] == ["mowing_pose_coverage"]
+    pose_data = property_changes[0][1]
+    assert pose_data["progress"]["progress_percent"] == 96.0
+    assert pose_data["coordinates"]["x"] == 100
     
     # Now simulate mission completion event (4:1) with 96% in the event
     completion_event = {
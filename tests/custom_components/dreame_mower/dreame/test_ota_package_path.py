@@ -9,8 +9,8 @@ from custom_components.dreame_mower.dreame.device import DreameMowerDevice
 
 @pytest.fixture
 def device():
-    """Create a test device instance."""
-    return DreameMowerDevice(
+    """Create a test device instance with its cloud executor running."""
+    device = DreameMowerDevice(
         device_id="test_device",
         username="test_user",
         password="test_pass",
@@ -18,6 +18,23 @@ def device():
         country="DE",
         hass_config_dir="/tmp/test_config"
     )
+    # The executor normally exists once connect() has made its first cloud call
+    device._get_cloud_executor()
+    yield device
+    _shutdown_cloud_executor(device)
+
+
+def _shutdown_cloud_executor(device):
+    """Shut down the device's cloud executor so no threads outlive the test."""
+    executor, device._cloud_executor = device._cloud_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _finish_download(device):
+    """Wait for the pending file download, then shut down the executor."""
+    device._file_download.result(timeout=5)
+    _shutdown_cloud_executor(device)
 
 
 def test_ota_package_path_handling(device):
@@ -48,6 +65,23 @@ def test_ota_package_path_handling(device):
     assert ("device_file_path", "ali_dreame/2025/10/11/JU954***/-1*******1_210019111.0430.pack.tbz2") in property_changes
 
 
+@pytest.mark.asyncio
+async def test_device_file_path_after_disconnect_skips_download(device):
+    """Test a file path arriving after disconnect neither downloads nor recreates the executor."""
+    device._cloud_device.disconnect = Mock()
+    await device.disconnect()
+
+    with patch.object(device._cloud_device, 'get_file_download_url') as mock_get_url:
+        assert device._handle_mqtt_property_update(
+            {"siid": 99, "piid": 10, "value": "ali_dreame/late.tbz2"}
+        ) is True
+
+    assert device.device_file_path == "ali_dreame/late.tbz2"
+    assert device._file_download is None
+    assert device._cloud_executor is None
+    mock_get_url.assert_not_called()
+
+
 def test_ota_package_path_initial_value(device):
     """Test that device file path is initially None."""
     assert device.device_file_path is None
@@ -121,6 +155,7 @@ def test_ota_package_download_success(mock_get, device):
         # Trigger download via property update
         message = {"siid": 99, "piid": 10, "value": "ali_dreame/2025/10/11/test/package.pack.tbz2"}
         device._handle_mqtt_property_update(message)
+        _finish_download(device)
         
         # Verify file was downloaded (mirroring the directory structure)
         expected_path = os.path.join(tmpdir, "www", "dreame", "ali_dreame/2025/10/11/test/package.pack.tbz2")
@@ -152,6 +187,7 @@ def test_ota_package_download_no_url(mock_get, device):
     # Trigger property update
     message = {"siid": 99, "piid": 10, "value": "ali_dreame/2025/10/11/test/package.pack.tbz2"}
     device._handle_mqtt_property_update(message)
+    _finish_download(device)
     
     # Verify no download notification (download failed)
     download_notifications = [pc for pc in property_changes if pc[0] == "device_file_downloaded"]
@@ -181,6 +217,7 @@ def test_ota_package_download_request_failure(mock_get, device):
     # Trigger property update
     message = {"siid": 99, "piid": 10, "value": "ali_dreame/2025/10/11/test/package.pack.tbz2"}
     device._handle_mqtt_property_update(message)
+    _finish_download(device)
     
     # Verify no download notification (download failed)
     download_notifications = [pc for pc in property_changes if pc[0] == "device_file_downloaded"]
@@ -221,6 +258,7 @@ def test_log_file_download_success(mock_get, device):
             "value": "ali_dreame/2025/10/11/JU954/-1*******1_210019111.0430.pack.tbz2"
         }
         device._handle_mqtt_property_update(message)
+        _finish_download(device)
         
         # Verify file was downloaded (mirroring the directory structure)
         expected_path = os.path.join(tmpdir, "www", "dreame", "ali_dreame/2025/10/11/JU954/-1*******1_210019111.0430.pack.tbz2")
@@ -1,6 +1,7 @@
 """Tests for the Dreame Mower Camera Entity."""
 import asyncio
 import json
+import os
 import re
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
@@ -18,11 +19,11 @@ GOLDEN_SVG_FILE = TEST_DATA_DIR / "test_svg_map_generator_rotated_0_golden.svg"
 
 
 @pytest.fixture
-def mock_coordinator():
+async def mock_coordinator():
     """Create a mock coordinator."""
     coordinator = Mock(spec=DreameMowerCoordinator)
     coordinator.hass = Mock()
-    coordinator.hass.loop = asyncio.get_event_loop()
+    coordinator.hass.loop = asyncio.get_running_loop()
     coordinator.device = Mock()
     coordinator.device.name = "Test Mower"
     coordinator.device.status_code = 1  # Some default status
@@ -41,9 +42,11 @@ def mock_config_entry():
 
 
 @pytest.fixture
-def camera_entity(mock_coordinator, mock_config_entry):
-    """Create a camera entity instance."""
-    return DreameMowerCameraEntity(mock_coordinator, mock_config_entry)
+async def camera_entity(mock_coordinator, mock_config_entry):
+    """Create a camera entity instance, removing it again after the test."""
+    camera = DreameMowerCameraEntity(mock_coordinator, mock_config_entry)
+    yield camera
+    await camera.async_will_remove_from_hass()
 
 
 @pytest.fixture
@@ -108,3 +111,117 @@ class TestDreameMowerCameraEntity:
             f"Actual file saved to: {actual_svg_file}"
         )
 
+
+    def test_newest_historical_file_rescanned_only_on_change(self, camera_entity, tmp_path):
+        """Test the newest historical file is found and subtrees are only rescanned on change."""
+        camera_entity.hass = Mock()
+        camera_entity.hass.config.config_dir = str(tmp_path)
+        day_dir = tmp_path / "www" / "dreame" / "ali_dreame" / "2025" / "10" / "11"
+        day_dir.mkdir(parents=True)
+        (day_dir / "first.json").write_text("{}")
+
+        newest = camera_entity._find_newest_historical_file_sync()
+        assert Path(newest[0]).name == "first.json"
+
+        # Nothing changed - the subtree is not scanned again
+        with patch.object(camera_entity, "_scan_subtree_sync") as mock_scan:
+            assert camera_entity._find_newest_historical_file_sync() == newest
+            mock_scan.assert_not_called()
+
+        # A newer file deep in the tree is picked up
+        second = day_dir / "second.json"
+        second.write_text("{}")
+        os.utime(second, (newest[1] + 10,) * 2)
+        os.utime(day_dir, (day_dir.stat().st_mtime + 10,) * 2)
+        newest = camera_entity._find_newest_historical_file_sync()
+        assert Path(newest[0]).name == "second.json"
+
+    def test_pose_coverage_interval_adapts_to_activity(self, camera_entity):
+        """Test the request interval backs off while idle and tightens on new coordinates."""
+        with patch("custom_components.dreame_mower.camera.time.monotonic", return_value=10_000.0):
+            camera_entity._last_activity_ts = 0.0
+            camera_entity._last_timer_ts = 0.0
+            camera_entity._adapt_timer_interval()
+            assert camera_entity._timer_interval == 240
+
+            camera_entity._last_activity_ts = 10_000.0
+            camera_entity._last_timer_ts = 9_000.0
+            camera_entity._adapt_timer_interval()
+            assert camera_entity._timer_interval == 120
+
+    def test_identical_image_bytes_are_not_stored_again(self, camera_entity):
+        """Test re-rendering byte-identical SVG keeps the current image object."""
+        first = b"<svg>map</svg>"
+        assert camera_entity._store_image_bytes(first) is True
+        assert camera_entity._store_image_bytes(bytes(bytearray(first))) is False
+        assert camera_entity._image_bytes is first
+        assert camera_entity._store_image_bytes(b"<svg>other</svg>") is True
+
+    def test_live_render_throttled_by_points_or_time(self, camera_entity):
+        """Test live renders wait for enough new points or the minimum interval."""
+        with patch("custom_components.dreame_mower.camera.time.monotonic", return_value=100.0):
+            camera_entity._last_render_ts = 100.0
+            camera_entity._live_points_received = 2
+            assert camera_entity._live_render_delay() == pytest.approx(0.5)
+
+            camera_entity._live_points_received = 5
+            assert camera_entity._live_render_delay() == pytest.approx(0.2)
+
+    async def test_unchanged_map_is_not_rendered_again(self, camera_entity, tmp_path):
+        """Test the static map is only regenerated when file, mtime or rotation change."""
+        map_file = tmp_path / "map.json"
+        map_file.write_text("{}")
+        camera_entity.hass = Mock()
+        camera_entity.hass.loop = asyncio.get_running_loop()
+        camera_entity.hass.config.config_dir = str(tmp_path)
+        camera_entity._newest_historical_file = (str(map_file), 1.0)
+        camera_entity._cache_built = True
+
+        with patch.object(camera_entity, "_generate_map_image", return_value=b"<svg/>") as mock_generate:
+            await camera_entity._async_update_image()
+            await camera_entity._async_update_image()
+            assert mock_generate.call_count == 1
+
+            camera_entity._current_rotation = 90
+            await camera_entity._async_update_image()
+            assert mock_generate.call_count == 2
+
+    async def test_newer_live_render_supersedes_older(self, camera_entity):
+        """Test an in-flight live render is discarded when a newer one starts."""
+        camera_entity.hass = Mock()
+        camera_entity.hass.loop = asyncio.get_running_loop()
+        camera_entity._live_coordinates.append({"x": 0, "y": 0})
+        camera_entity._live_points_received = 1
+
+        with patch.object(camera_entity, "_generate_live_image", return_value=b"<svg/>"):
+            older = asyncio.ensure_future(camera_entity._async_update_live_image())
+            await asyncio.sleep(0)
+            camera_entity._live_points_received = 2
+            assert await camera_entity._async_update_live_image() is True
+            assert await older is False
+            assert camera_entity._last_render_points == 2
+
+        # Removing the entity stops the render thread the live renders ran on
+        await camera_entity.async_will_remove_from_hass()
+        with pytest.raises(RuntimeError):
+            camera_entity._svg_executor.submit(lambda: None)
+
+    async def test_removal_unregisters_property_callback(self, camera_entity, mock_coordinator):
+        """Test removing the entity stops device property callbacks."""
+        handle = mock_coordinator.device.register_property_callback.return_value
+
+        await camera_entity.async_will_remove_from_hass()
+
+        mock_coordinator.device.unregister_property_callback.assert_called_with(handle)
+
+    async def test_no_render_while_turned_off(self, camera_entity):
+        """Test image updates are skipped while the camera is off."""
+        await camera_entity.async_turn_off()
+        camera_entity._live_coordinates.append({"x": 0, "y": 0})
+
+        with patch.object(camera_entity, "_find_most_recent_historical_file") as mock_find, \
+             patch.object(camera_entity, "_generate_live_image") as mock_generate:
+            assert await camera_entity._async_update_image() is False
+            assert await camera_entity._async_update_live_image() is False
+            mock_find.assert_not_called()
+            mock_generate.assert_not_called()
@@ -1,12 +1,16 @@
 """Test the Dreame Mower coordinator."""
 
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.dreame_mower.coordinator import DreameMowerCoordinator
+from custom_components.dreame_mower.coordinator import DreameMowerCoordinator, PROPERTY_TO_DATA_KEYS
 from custom_components.dreame_mower.const import DOMAIN
+from custom_components.dreame_mower.dreame.device import DreameMowerDevice
 from custom_components.dreame_mower.config_flow import CONF_ACCOUNT_TYPE, CONF_COUNTRY, CONF_DID, CONF_MAC, CONF_MODEL, CONF_SERIAL
 
 
@@ -106,4 +110,58 @@ async def test_coordinator_with_required_config_data(hass: HomeAssistant):
     data = await coordinator._async_update_data()
     
     # Should use provided name from config
-    assert data["name"] == "Test Required Mower"
\ No newline at end of file
+    assert data["name"] == "Test Required Mower"
+
+async def test_device_update_burst_coalesced(hass: HomeAssistant, minimal_config_entry):
+    """Test a burst of device property updates triggers a single coordinator refresh."""
+    coordinator = DreameMowerCoordinator(hass, entry=minimal_config_entry)
+
+    with patch.object(coordinator, "_async_handle_device_update", AsyncMock()) as mock_refresh:
+        for _ in range(5):
+            coordinator._handle_device_update("battery_percent", 80)
+        await asyncio.sleep(coordinator._refresh_delay * 4)
+        await hass.async_block_till_done()
+
+    mock_refresh.assert_awaited_once()
+
+
+async def test_disconnect_does_not_leave_refresh_armed(hass: HomeAssistant, minimal_config_entry):
+    """Test the connected=False update sent while disconnecting triggers no later refresh."""
+    coordinator = DreameMowerCoordinator(hass, entry=minimal_config_entry)
+
+    async def disconnect(device):
+        coordinator._handle_device_update("connected", False)
+
+    with patch.object(DreameMowerDevice, "disconnect", disconnect), \
+         patch.object(coordinator, "_async_handle_device_update", AsyncMock()) as mock_refresh:
+        await coordinator.async_disconnect_device()
+        await asyncio.sleep(coordinator._refresh_delay * 4)
+        await hass.async_block_till_done()
+
+    assert coordinator._refresh_handle is None
+    assert coordinator._refresh_requested is False
+    mock_refresh.assert_not_awaited()
+
+
+async def test_device_update_refreshes_only_touched_keys(hass: HomeAssistant, minimal_config_entry):
+    """Test a device update only re-reads the data keys affected by that property."""
+    coordinator = DreameMowerCoordinator(hass, entry=minimal_config_entry)
+    data = await coordinator._async_update_data()
+
+    coordinator.device._battery_percent = 42
+    coordinator.device._status_code = 99
+    coordinator._dirty_keys.update(PROPERTY_TO_DATA_KEYS["battery_percent"])
+    await coordinator._async_handle_device_update()
+
+    assert coordinator.data is data
+    assert data["battery_percent"] == 42
+    assert data["status"] != coordinator.device_status
+
+
+async def test_coordinator_async_create(hass: HomeAssistant, minimal_config_entry):
+    """Test the coordinator can be created with the device built in the executor."""
+    coordinator = await DreameMowerCoordinator.async_create(hass, minimal_config_entry)
+
+    assert coordinator.entry == minimal_config_entry
+    assert coordinator.device is not None
+    assert coordinator.device_name == "Test Mower"
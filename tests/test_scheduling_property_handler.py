@@ -200,6 +200,14 @@ class TestSummaryHandler:
         result = self.handler.parse_value("not a dict")
         assert result is False
 
+    def test_summary_data_is_read_only(self):
+        """Test summary data is exposed as a read-only view."""
+        self.handler.parse_value({'area': 100})
+
+        with pytest.raises(TypeError):
+            self.handler.summary_data['area'] = 0
+        assert self.handler.summary_data == {'area': 100}
+
     def test_get_notification_data(self):
         """Test getting notification data."""
         summary_data = {'area': 100, 'duration': 1800}